@@ -1,3 +1,4 @@
+import functools
 import importlib
 import inspect
 import logging
@@ -8,6 +9,7 @@ import typing as T
 from backgrounds.base import Background
 
 
+@functools.lru_cache(maxsize=None)
 def find_module_with_class(class_name: str) -> T.Optional[str]:
     """
     Find which module file contains the specified class name.
@@ -27,25 +29,26 @@ def find_module_with_class(class_name: str) -> T.Optional[str]:
     if not os.path.exists(plugins_dir):
         return None
 
-    plugin_files = [f for f in os.listdir(plugins_dir) if f.endswith(".py")]
+    pattern = re.compile(
+        rf"^class\s+{re.escape(class_name)}\s*\([^)]*Background[^)]*\)\s*:".encode(),
+        re.MULTILINE,
+    )
 
-    for plugin_file in plugin_files:
-        file_path = os.path.join(plugins_dir, plugin_file)
+    with os.scandir(plugins_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".py") or not entry.is_file():
+                continue
 
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            try:
+                with open(entry.path, "rb") as f:
+                    content = f.read()
 
-            pattern = (
-                rf"^class\s+{re.escape(class_name)}\s*\([^)]*Background[^)]*\)\s*:"
-            )
+                if pattern.search(content):
+                    return entry.name[:-3]
 
-            if re.search(pattern, content, re.MULTILINE):
-                return plugin_file[:-3]
-
-        except Exception as e:
-            logging.warning(f"Could not read {plugin_file}: {e}")
-            continue
+            except Exception as e:
+                logging.warning(f"Could not read {entry.name}: {e}")
+                continue
 
     return None
 
@@ -1,3 +1,4 @@
+import functools
 import importlib
 import inspect
 import logging
@@ -8,6 +9,7 @@ import typing as T
 from inputs.base import Sensor
 
 
+@functools.lru_cache(maxsize=None)
 def find_module_with_class(class_name: str) -> T.Optional[str]:
     """
     Find which module file contains the specified class name.
@@ -27,6 +29,11 @@ def find_module_with_class(class_name: str) -> T.Optional[str]:
     if not os.path.exists(plugins_dir):
         return None
 
+    pattern = re.compile(
+        rf"^class\s+{re.escape(class_name)}\s*\([^)]*FuserInput[^)]*\)\s*:",
+        re.MULTILINE,
+    )
+
     plugin_files = [f for f in os.listdir(plugins_dir) if f.endswith(".py")]
 
     for plugin_file in plugin_files:
@@ -36,11 +43,7 @@ def find_module_with_class(class_name: str) -> T.Optional[str]:
             with open(file_path, "r", encoding="utf-8") as f:
                 content = f.read()
 
-            pattern = (
-                rf"^class\s+{re.escape(class_name)}\s*\([^)]*FuserInput[^)]*\)\s*:"
-            )
-
-            if re.search(pattern, content, re.MULTILINE):
+            if pattern.search(content):
                 return plugin_file[:-3]
 
         except Exception as e:
@@ -70,13 +70,13 @@ class GoogleASRInput(FuserInput[str]):
 
         language = getattr(self.config, "language", "english").strip().lower()
 
-        if language not in LANGUAGE_CODE_MAP:
+        language_code = LANGUAGE_CODE_MAP.get(language)
+        if language_code is None:
             logging.error(
                 f"Language {language} not supported. Current supported languages are : {list(LANGUAGE_CODE_MAP.keys())}. Defaulting to English"
             )
-            language = "english"
+            language_code = LANGUAGE_CODE_MAP["english"]
 
-        language_code = LANGUAGE_CODE_MAP.get(language, "en-US")
         logging.info(f"Using language code {language_code} for Google ASR")
 
         remote_input = getattr(self.config, "remote_input", False)
@@ -1,3 +1,4 @@
+import functools
 import importlib
 import inspect
 import logging
@@ -139,6 +140,7 @@ class LLM(T.Generic[R]):
         raise NotImplementedError
 
 
+@functools.lru_cache(maxsize=None)
 def find_module_with_class(class_name: str) -> T.Optional[str]:
     """
     Find which module file contains the specified class name.
@@ -158,6 +160,10 @@ def find_module_with_class(class_name: str) -> T.Optional[str]:
     if not os.path.exists(plugins_dir):
         return None
 
+    pattern = re.compile(
+        rf"^class\s+{re.escape(class_name)}\s*\([^)]*LLM[^)]*\)\s*:", re.MULTILINE
+    )
+
     plugin_files = [f for f in os.listdir(plugins_dir) if f.endswith(".py")]
 
     for plugin_file in plugin_files:
@@ -167,9 +173,7 @@ def find_module_with_class(class_name: str) -> T.Optional[str]:
             with open(file_path, "r", encoding="utf-8") as f:
                 content = f.read()
 
-            pattern = rf"^class\s+{re.escape(class_name)}\s*\([^)]*LLM[^)]*\)\s*:"
-
-            if re.search(pattern, content, re.MULTILINE):
+            if pattern.search(content):
                 return plugin_file[:-3]
 
         except Exception as e:
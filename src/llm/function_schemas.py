@@ -4,6 +4,7 @@ Utility functions for generating OpenAI function schemas from AgentActions.
 This module is separate from both the actions and llm modules to avoid circular imports.
 """
 
+import functools
 import json
 import logging
 from enum import Enum
@@ -16,6 +17,9 @@ def generate_function_schema_from_action(action) -> dict:
     """
     Generate OpenAI function schema from an AgentAction.
 
+    Schemas are memoized per (llm_label, interface) pair, so LLMs rebuilt on a
+    mode switch reuse them; the returned dict is shared and must not be mutated.
+
     Parameters
     ----------
     action : AgentAction
@@ -26,7 +30,26 @@ def generate_function_schema_from_action(action) -> dict:
     dict
         OpenAI function schema dictionary.
     """
-    interface = action.interface
+    return _generate_function_schema(action.llm_label, action.interface)
+
+
+@functools.lru_cache(maxsize=None)
+def _generate_function_schema(llm_label: str, interface: type) -> dict:
+    """
+    Build the OpenAI function schema for an action interface.
+
+    Parameters
+    ----------
+    llm_label : str
+        The function name exposed to the LLM.
+    interface : type
+        The action's Interface dataclass.
+
+    Returns
+    -------
+    dict
+        OpenAI function schema dictionary.
+    """
     input_interface = get_type_hints(interface)["input"]
 
     doc = interface.__doc__ or ""
@@ -74,8 +97,8 @@ def generate_function_schema_from_action(action) -> dict:
     return {
         "type": "function",
         "function": {
-            "name": action.llm_label,
-            "description": doc or f"Execute {action.llm_label} action",
+            "name": llm_label,
+            "description": doc or f"Execute {llm_label} action",
             "parameters": {
                 "type": "object",
                 "properties": properties,
@@ -41,7 +41,7 @@ class TransitionType(Enum):
     MANUAL = "manual"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TransitionRule:
     """
     Defines a rule for transitioning between modes.
@@ -69,11 +69,11 @@ class TransitionRule:
     from_mode: str
     to_mode: str
     transition_type: TransitionType
-    trigger_keywords: List[str] = field(default_factory=list)
+    trigger_keywords: List[str] = field(default_factory=list, hash=False)
     priority: int = 1
     cooldown_seconds: float = 0.0
     timeout_seconds: Optional[float] = None
-    context_conditions: Dict = field(default_factory=dict)
+    context_conditions: Dict = field(default_factory=dict, hash=False)
 
 
 @dataclass
@@ -91,6 +91,7 @@ class ModeConfig:
     timeout_seconds: Optional[float] = None
     remember_locations: bool = False
     save_interactions: bool = False
+    parallel_hooks: bool = False
 
     lifecycle_hooks: List[LifecycleHook] = field(default_factory=list)
     _raw_lifecycle_hooks: List[Dict] = field(default_factory=list)
@@ -202,7 +203,9 @@ class ModeConfig:
             }
         )
 
-        return await execute_lifecycle_hooks(self.lifecycle_hooks, hook_type, context)
+        return await execute_lifecycle_hooks(
+            self.lifecycle_hooks, hook_type, context, parallel=self.parallel_hooks
+        )
 
 
 @dataclass
@@ -217,6 +220,7 @@ class ModeSystemConfig:
     config_name: str = ""
     allow_manual_switching: bool = True
     mode_memory_enabled: bool = True
+    parallel_hooks: bool = False
 
     # Global parameters
     api_key: Optional[str] = None
@@ -261,7 +265,10 @@ class ModeSystemConfig:
         context.update({"system_name": self.name, "is_global_hook": True})
 
         return await execute_lifecycle_hooks(
-            self.global_lifecycle_hooks, hook_type, context
+            self.global_lifecycle_hooks,
+            hook_type,
+            context,
+            parallel=self.parallel_hooks,
         )
 
 
@@ -320,6 +327,7 @@ def load_mode_config(config_name: str) -> ModeSystemConfig:
         config_name=config_name,
         allow_manual_switching=raw_config.get("allow_manual_switching", True),
         mode_memory_enabled=raw_config.get("mode_memory_enabled", True),
+        parallel_hooks=raw_config.get("parallel_hooks", False),
         api_key=g_api_key,
         robot_ip=g_robot_ip,
         URID=g_URID,
@@ -344,6 +352,7 @@ def load_mode_config(config_name: str) -> ModeSystemConfig:
             timeout_seconds=mode_data.get("timeout_seconds"),
             remember_locations=mode_data.get("remember_locations", False),
             save_interactions=mode_data.get("save_interactions", False),
+            parallel_hooks=mode_system_config.parallel_hooks,
             _raw_inputs=mode_data.get("agent_inputs", []),
             _raw_llm=mode_data.get("cortex_llm"),
             _raw_simulators=mode_data.get("simulators", []),
@@ -1,11 +1,26 @@
 import asyncio
+import functools
 import importlib
+import itertools
 import logging
+import operator
 import os
 import re
-from dataclasses import dataclass
+from collections import ChainMap
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
 
 from providers.elevenlabs_tts_provider import ElevenLabsTTSProvider
 
@@ -28,7 +43,7 @@ class LifecycleHookType(Enum):
     ON_TIMEOUT = "on_timeout"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LifecycleHook:
     """
     Configuration for a lifecycle hook.
@@ -49,11 +64,14 @@ class LifecycleHook:
         Action to take on failure ('ignore', 'abort') (default: 'ignore')
     priority : int
         Execution priority for multiple hooks of same type (higher = first) (default: 0)
+
+    Hooks are immutable once parsed; handler_config is left out of the hash
+    since it is a plain dict.
     """
 
     hook_type: LifecycleHookType
     handler_type: str
-    handler_config: Dict[str, Any]
+    handler_config: Dict[str, Any] = field(hash=False)
     async_execution: bool = True
     timeout_seconds: Optional[float] = 5.0
     on_failure: str = "ignore"
@@ -68,13 +86,13 @@ class LifecycleHookHandler:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
 
-    async def execute(self, context: Dict[str, Any]) -> bool:
+    async def execute(self, context: Mapping[str, Any]) -> bool:
         """
         Execute the lifecycle hook.
 
         Parameters
         ----------
-        context : Dict[str, Any]
+        context : Mapping[str, Any]
             Context information for the hook execution
 
         Returns
@@ -90,11 +108,11 @@ class MessageHookHandler(LifecycleHookHandler):
     Handler that logs or announces a message.
     """
 
-    async def execute(self, context: Dict[str, Any]) -> bool:
+    async def execute(self, context: Mapping[str, Any]) -> bool:
         message = self.config.get("message", "")
         if message:
             try:
-                formatted_message = message.format(**context)
+                formatted_message = message.format_map(context)
                 logging.info(f"Lifecycle hook message: {formatted_message}")
 
                 try:
@@ -115,14 +133,14 @@ class CommandHookHandler(LifecycleHookHandler):
     Handler that executes a shell command.
     """
 
-    async def execute(self, context: Dict[str, Any]) -> bool:
+    async def execute(self, context: Mapping[str, Any]) -> bool:
         command = self.config.get("command", "")
         if not command:
             logging.warning("No command specified for command hook")
             return False
 
         try:
-            formatted_command = command.format(**context)
+            formatted_command = command.format_map(context)
 
             process = await asyncio.create_subprocess_shell(
                 formatted_command,
@@ -147,12 +165,16 @@ class CommandHookHandler(LifecycleHookHandler):
             return False
 
 
+# Functions resolved by FunctionHookHandler, keyed by (module_name, function_name)
+_function_cache: Dict[Tuple[str, str], Callable[..., Any]] = {}
+
+
 class FunctionHookHandler(LifecycleHookHandler):
     """
     Handler that calls a Python function from a specified module.
     """
 
-    async def execute(self, context: Dict[str, Any]) -> bool:
+    async def execute(self, context: Mapping[str, Any]) -> bool:
         module_name = self.config.get("module_name")
         function_name = self.config.get("function")
 
@@ -180,10 +202,41 @@ class FunctionHookHandler(LifecycleHookHandler):
             logging.error(f"Error executing lifecycle function: {e}")
             return False
 
-    def _find_function_in_module(self, module_name: str, function_name: str):
+    @staticmethod
+    def _find_function_in_module(module_name: str, function_name: str):
         """
         Search for a function in the specified module file using regex.
 
+        Functions that are found are cached per (module_name, function_name);
+        failed lookups are not cached, so they are retried on the next call.
+
+        Parameters
+        ----------
+        module_name : str
+            Name of the module file (without .py extension)
+        function_name : str
+            Name of the function to find
+
+        Returns
+        -------
+        callable or None
+            The function if found, None otherwise
+        """
+        key = (module_name, function_name)
+        func = _function_cache.get(key)
+        if func is None:
+            func = FunctionHookHandler._load_function_from_module(
+                module_name, function_name
+            )
+            if func is not None:
+                _function_cache[key] = func
+        return func
+
+    @staticmethod
+    def _load_function_from_module(module_name: str, function_name: str):
+        """
+        Locate a function in a hooks module file and import it.
+
         Parameters
         ----------
         module_name : str
@@ -265,7 +318,7 @@ class ActionHookHandler(LifecycleHookHandler):
         super().__init__(config)
         self.action = None
 
-    async def execute(self, context: Dict[str, Any]) -> bool:
+    async def execute(self, context: Mapping[str, Any]) -> bool:
         if not self.action:
             action_type = self.config.get("action_type")
             if not action_type:
@@ -291,10 +344,25 @@ class ActionHookHandler(LifecycleHookHandler):
             return False
 
 
+_HANDLER_CLASSES: Dict[str, Type[LifecycleHookHandler]] = {
+    "message": MessageHookHandler,
+    "command": CommandHookHandler,
+    "function": FunctionHookHandler,
+    "action": ActionHookHandler,
+}
+
+_STATELESS_HANDLER_TYPES = frozenset({"message", "command", "function"})
+
+
 def create_hook_handler(hook: LifecycleHook) -> Optional[LifecycleHookHandler]:
     """
     Create a hook handler instance based on the hook configuration.
 
+    Message, command and function handlers keep no state between executions,
+    so they are memoized per hook and a hook that fires on every mode entry
+    reuses its handler. Action handlers hold the action they load, so every
+    call builds a fresh one.
+
     Parameters
     ----------
     hook : LifecycleHook
@@ -306,18 +374,55 @@ def create_hook_handler(hook: LifecycleHook) -> Optional[LifecycleHookHandler]:
         The created handler instance or None if creation failed
     """
     handler_type = hook.handler_type.lower()
+    if handler_type in _STATELESS_HANDLER_TYPES:
+        return _create_stateless_hook_handler(hook)
+    return _build_hook_handler(handler_type, hook.handler_config)
 
-    if handler_type == "message":
-        return MessageHookHandler(hook.handler_config)
-    elif handler_type == "command":
-        return CommandHookHandler(hook.handler_config)
-    elif handler_type == "function":
-        return FunctionHookHandler(hook.handler_config)
-    elif handler_type == "action":
-        return ActionHookHandler(hook.handler_config)
-    else:
+
+@functools.lru_cache(maxsize=256)
+def _create_stateless_hook_handler(hook: LifecycleHook) -> LifecycleHookHandler:
+    """
+    Build the handler for a message, command or function hook, memoized.
+
+    The cache key is the frozen hook itself: handler_config is left out of its
+    hash but still compared for equality, so only equal hooks share a handler.
+
+    Parameters
+    ----------
+    hook : LifecycleHook
+        A hook whose handler type is in _STATELESS_HANDLER_TYPES
+
+    Returns
+    -------
+    LifecycleHookHandler
+        The handler, built with the hook's own handler_config
+    """
+    return _HANDLER_CLASSES[hook.handler_type.lower()](hook.handler_config)
+
+
+def _build_hook_handler(
+    handler_type: str, handler_config: Dict[str, Any]
+) -> Optional[LifecycleHookHandler]:
+    """
+    Build a new handler for the given handler type.
+
+    Parameters
+    ----------
+    handler_type : str
+        The lowercased handler type
+    handler_config : Dict[str, Any]
+        Configuration for the handler
+
+    Returns
+    -------
+    Optional[LifecycleHookHandler]
+        The new handler instance, or None if the handler type is unknown
+    """
+    handler_class = _HANDLER_CLASSES.get(handler_type)
+    if handler_class is None:
         logging.error(f"Unknown hook handler type: {handler_type}")
         return None
+    return handler_class(handler_config)
 
 
 def parse_lifecycle_hooks(raw_hooks: List[Dict]) -> List[LifecycleHook]:
@@ -332,7 +437,8 @@ def parse_lifecycle_hooks(raw_hooks: List[Dict]) -> List[LifecycleHook]:
     Returns
     -------
     List[LifecycleHook]
-        Parsed lifecycle hook objects
+        Parsed lifecycle hook objects, highest priority first (ties keep their
+        configured order), so the sort in execute_lifecycle_hooks is a single pass
     """
     hooks = []
     for hook_data in raw_hooks:
@@ -350,13 +456,69 @@ def parse_lifecycle_hooks(raw_hooks: List[Dict]) -> List[LifecycleHook]:
         except (KeyError, ValueError) as e:
             logging.error(f"Error parsing lifecycle hook: {e}")
 
+    hooks.sort(key=operator.attrgetter("priority"), reverse=True)
     return hooks
 
 
+async def _execute_with_timeout(
+    handler: LifecycleHookHandler, context: Mapping[str, Any], timeout_seconds: float
+) -> bool:
+    """
+    Execute a hook handler, raising asyncio.TimeoutError if it overruns.
+
+    asyncio.timeout (Python 3.11+) bounds the await in the current task, whereas
+    asyncio.wait_for wraps the handler in an extra Task on older versions.
+    """
+    timeout = getattr(asyncio, "timeout", None)
+    if timeout is not None:
+        async with timeout(timeout_seconds):
+            return await handler.execute(context)
+    return await asyncio.wait_for(handler.execute(context), timeout=timeout_seconds)
+
+
+async def _run_lifecycle_hook(
+    hook: LifecycleHook, context: Mapping[str, Any]
+) -> Optional[bool]:
+    """
+    Run a single lifecycle hook, logging why it failed if it did.
+
+    Parameters
+    ----------
+    hook : LifecycleHook
+        The hook to run
+    context : Mapping[str, Any]
+        Context information to pass to the hook's handler
+
+    Returns
+    -------
+    Optional[bool]
+        True if the handler reported success, False if it failed, timed out or
+        raised, and None if no handler could be created; a missing handler
+        counts as a failure but never triggers the hook's abort policy
+    """
+    try:
+        handler = create_hook_handler(hook)
+        if not handler:
+            logging.error(
+                "Failed to create handler for lifecycle hook: %s", hook.handler_type
+            )
+            return None
+
+        if hook.async_execution and hook.timeout_seconds:
+            return await _execute_with_timeout(handler, context, hook.timeout_seconds)
+        return await handler.execute(context)
+    except asyncio.TimeoutError:
+        logging.error("Lifecycle hook timed out after %s seconds", hook.timeout_seconds)
+    except Exception as e:
+        logging.error("Error executing lifecycle hook: %s", e)
+    return False
+
+
 async def execute_lifecycle_hooks(
     hooks: List[LifecycleHook],
     hook_type: LifecycleHookType,
-    context: Optional[Dict[str, Any]] = None,
+    context: Optional[Mapping[str, Any]] = None,
+    parallel: bool = False,
 ) -> bool:
     """
     Execute all lifecycle hooks of the specified type.
@@ -367,69 +529,95 @@ async def execute_lifecycle_hooks(
         List of hooks to potentially execute
     hook_type : LifecycleHookType
         The type of lifecycle hooks to execute
-    context : Optional[Dict[str, Any]]
-        Context information to pass to the hooks
+    context : Optional[Mapping[str, Any]]
+        Context information to pass to the hooks; a dict is updated in place with
+        hook_type, while read-only mappings are overlaid with a ChainMap instead
+    parallel : bool
+        Run hooks that share a priority concurrently; hooks with the 'abort'
+        failure policy still run one at a time ahead of the rest of their
+        priority band (default: False)
 
     Returns
     -------
     bool
         True if all hooks executed successfully, False if any failed
     """
+    relevant_hooks = [hook for hook in hooks if hook.hook_type == hook_type]
+    if not relevant_hooks:
+        return True
+
+    relevant_hooks.sort(key=operator.attrgetter("priority"), reverse=True)
+
     if context is None:
         context = {}
 
-    context.update({"hook_type": hook_type.value})
-
-    relevant_hooks = [hook for hook in hooks if hook.hook_type == hook_type]
-    relevant_hooks.sort(key=lambda h: h.priority, reverse=True)
+    if isinstance(context, dict):
+        context.update({"hook_type": hook_type.value})
+    else:
+        # ChainMap only ever writes to its first map, so the context is not mutated
+        context = ChainMap(
+            {"hook_type": hook_type.value}, cast(MutableMapping[str, Any], context)
+        )
 
-    if not relevant_hooks:
-        return True
+    logging.info("Executing %d %s hooks", len(relevant_hooks), hook_type.value)
 
-    logging.info(f"Executing {len(relevant_hooks)} {hook_type.value} hooks")
+    if parallel:
+        return await _execute_hooks_by_priority(relevant_hooks, context)
 
     all_successful = True
 
     for hook in relevant_hooks:
-        try:
-            handler = create_hook_handler(hook)
-            if handler:
-                if hook.async_execution:
-                    if hook.timeout_seconds:
-                        success = await asyncio.wait_for(
-                            handler.execute(context), timeout=hook.timeout_seconds
-                        )
-                    else:
-                        success = await handler.execute(context)
-                else:
-                    success = await handler.execute(context)
+        result = await _run_lifecycle_hook(hook, context)
+        if not result:
+            all_successful = False
+            if result is False and hook.on_failure == "abort":
+                logging.error(
+                    "Lifecycle hook failed with abort policy, stopping execution"
+                )
+                return False
 
-                if not success:
-                    all_successful = False
-                    if hook.on_failure == "abort":
-                        logging.error(
-                            "Lifecycle hook failed with abort policy, stopping execution"
-                        )
-                        return False
-                    if hook.on_failure == "ignore":
-                        pass
-            else:
+    return all_successful
+
+
+async def _execute_hooks_by_priority(
+    hooks: List[LifecycleHook], context: Mapping[str, Any]
+) -> bool:
+    """
+    Execute priority-sorted hooks band by band, gathering the 'ignore' hooks.
+
+    Parameters
+    ----------
+    hooks : List[LifecycleHook]
+        Hooks of a single type, sorted by descending priority
+    context : Mapping[str, Any]
+        Context information to pass to the hooks
+
+    Returns
+    -------
+    bool
+        True if all hooks executed successfully, False if any failed
+    """
+    all_successful = True
+
+    for _, band in itertools.groupby(hooks, key=operator.attrgetter("priority")):
+        concurrent_hooks = []
+        for hook in band:
+            if hook.on_failure != "abort":
+                concurrent_hooks.append(hook)
+                continue
+
+            result = await _run_lifecycle_hook(hook, context)
+            if result is False:
                 logging.error(
-                    f"Failed to create handler for lifecycle hook: {hook.handler_type}"
+                    "Lifecycle hook failed with abort policy, stopping execution"
                 )
+                return False
+            if result is None:
                 all_successful = False
 
-        except asyncio.TimeoutError:
-            logging.error(
-                f"Lifecycle hook timed out after {hook.timeout_seconds} seconds"
-            )
-            all_successful = False
-            if hook.on_failure == "abort":
-                return False
-        except Exception as e:
-            logging.error(f"Error executing lifecycle hook: {e}")
-            all_successful = False
-            if hook.on_failure == "abort":
-                return False
+        results = await asyncio.gather(
+            *(_run_lifecycle_hook(hook, context) for hook in concurrent_hooks)
+        )
+        all_successful = all_successful and all(results)
 
     return all_successful
@@ -4,7 +4,7 @@ import logging
 import os
 import time
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import zenoh
 
@@ -69,10 +69,12 @@ class ModeManager:
         """
         self.config = config
         self.state = ModeState(current_mode=config.default_mode)
+        # Last trigger time per "from->to" key, on the time.monotonic() clock
         self.transition_cooldowns: Dict[str, float] = {}
         self.pending_transitions: List[TransitionRule] = []
         self._transition_callbacks: List = []
         self._main_event_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._state_file_path: Optional[str] = None
 
         # Validate configuration
         if config.default_mode not in config.modes:
@@ -80,6 +82,17 @@ class ModeManager:
                 f"Default mode '{config.default_mode}' not found in available modes"
             )
 
+        # Input-triggered rules per from_mode with lowercased keywords, built once
+        self._input_rules_by_mode = self._index_input_rules()
+        self._rules_by_mode = self._group_rules_by_mode(self.config.transition_rules)
+        self._time_rules_by_mode = self._group_rules_by_mode(
+            [
+                rule
+                for rule in self.config.transition_rules
+                if rule.transition_type == TransitionType.TIME_BASED
+            ]
+        )
+
         # Load persisted state if enabled
         if config.mode_memory_enabled:
             self._load_mode_state()
@@ -192,15 +205,14 @@ class ModeManager:
         Optional[str]
             The target mode if a transition should occur, None otherwise
         """
-        current_time = time.time()
-        mode_duration = current_time - self.state.mode_start_time
-
         # Check if current mode has a timeout
         current_config = self.current_mode_config
-        if (
-            current_config.timeout_seconds
-            and mode_duration >= current_config.timeout_seconds
-        ):
+        if not current_config.timeout_seconds:
+            return None
+
+        current_time = time.time()
+        mode_duration = current_time - self.state.mode_start_time
+        if mode_duration >= current_config.timeout_seconds:
             timeout_context = {
                 "mode_name": self.state.current_mode,
                 "timeout_seconds": current_config.timeout_seconds,
@@ -215,15 +227,15 @@ class ModeManager:
             except Exception as e:
                 logging.error(f"Error executing timeout lifecycle hooks: {e}")
 
-            for rule in self.config.transition_rules:
-                if (
-                    rule.from_mode == self.state.current_mode or rule.from_mode == "*"
-                ) and rule.transition_type == TransitionType.TIME_BASED:
-                    if self._can_transition(rule):
-                        logging.info(
-                            f"Time-based transition triggered: {self.state.current_mode} -> {rule.to_mode}"
-                        )
-                        return rule.to_mode
+            current_mode = self.state.current_mode
+            for rule in self._time_rules_by_mode.get(
+                current_mode, self._time_rules_by_mode["*"]
+            ):
+                if self._can_transition(rule):
+                    logging.info(
+                        f"Time-based transition triggered: {current_mode} -> {rule.to_mode}"
+                    )
+                    return rule.to_mode
 
         return None
 
@@ -246,32 +258,74 @@ class ModeManager:
 
         input_lower = input_text.lower()
 
-        # Find matching transition rules sorted by priority (higher priority first)
-        matching_rules = []
-        for rule in self.config.transition_rules:
-            if (
-                rule.from_mode == self.state.current_mode or rule.from_mode == "*"
-            ) and rule.transition_type == TransitionType.INPUT_TRIGGERED:
-
-                # Check if any trigger keywords are present
-                for keyword in rule.trigger_keywords:
-                    if keyword.lower() in input_lower:
-                        if self._can_transition(rule):
-                            matching_rules.append(rule)
-                        break
-
-        if matching_rules:
-            # Sort by priority (higher first) and select the best match
-            matching_rules.sort(key=lambda r: r.priority, reverse=True)
-            best_rule = matching_rules[0]
-            logging.info(
-                f"Input-triggered transition: {self.state.current_mode} -> {best_rule.to_mode}"
-            )
-            logging.info(f"Triggered by keywords: {best_rule.trigger_keywords}")
-            return best_rule.to_mode
+        # Rules are stored highest priority first, so the first match wins
+        rules = self._input_rules_by_mode.get(
+            self.state.current_mode, self._input_rules_by_mode["*"]
+        )
+        for rule, keywords in rules:
+            if any(keyword in input_lower for keyword in keywords):
+                if self._can_transition(rule):
+                    logging.info(
+                        f"Input-triggered transition: {self.state.current_mode} -> {rule.to_mode}"
+                    )
+                    logging.info(f"Triggered by keywords: {rule.trigger_keywords}")
+                    return rule.to_mode
 
         return None
 
+    def _index_input_rules(
+        self,
+    ) -> Dict[str, List[Tuple[TransitionRule, Tuple[str, ...]]]]:
+        """
+        Group input-triggered rules by the mode they can fire from.
+
+        Each mode's bucket also holds the wildcard ("*") rules, sorted by
+        priority (higher first, ties in config order) and paired with their
+        lowercased trigger keywords.
+
+        Returns
+        -------
+        Dict[str, List[Tuple[TransitionRule, Tuple[str, ...]]]]
+            Rules keyed by mode name, plus "*" for the wildcard-only bucket
+        """
+        input_rules = [
+            (rule, tuple(keyword.lower() for keyword in rule.trigger_keywords))
+            for rule in self.config.transition_rules
+            if rule.transition_type == TransitionType.INPUT_TRIGGERED
+        ]
+
+        rules_by_mode = {}
+        for mode_name in [*self.config.modes, "*"]:
+            bucket = [
+                entry for entry in input_rules if entry[0].from_mode in (mode_name, "*")
+            ]
+            bucket.sort(key=lambda entry: entry[0].priority, reverse=True)
+            rules_by_mode[mode_name] = bucket
+        return rules_by_mode
+
+    def _group_rules_by_mode(
+        self, rules: List[TransitionRule]
+    ) -> Dict[str, List[TransitionRule]]:
+        """
+        Group transition rules by the mode they can fire from.
+
+        Each mode's bucket also holds the wildcard ("*") rules, in config order.
+
+        Parameters
+        ----------
+        rules : List[TransitionRule]
+            The rules to group
+
+        Returns
+        -------
+        Dict[str, List[TransitionRule]]
+            Rules keyed by mode name, plus "*" for the wildcard-only bucket
+        """
+        return {
+            mode_name: [rule for rule in rules if rule.from_mode in (mode_name, "*")]
+            for mode_name in [*self.config.modes, "*"]
+        }
+
     def _can_transition(self, rule: TransitionRule) -> bool:
         """
         Check if a transition rule can be executed based on cooldowns and other constraints.
@@ -286,7 +340,7 @@ class ModeManager:
         bool
             True if the transition can occur, False otherwise
         """
-        current_time = time.time()
+        current_time = time.monotonic()
 
         transition_key = f"{rule.from_mode}->{rule.to_mode}"
         if transition_key in self.transition_cooldowns:
@@ -327,14 +381,14 @@ class ModeManager:
             logging.warning("Manual mode switching is disabled")
             return False
 
-        if target_mode not in self.config.modes:
-            logging.error(f"Target mode '{target_mode}' not found")
-            return False
-
         if target_mode == self.state.current_mode:
             logging.info(f"Already in mode '{target_mode}'")
             return True
 
+        if target_mode not in self.config.modes:
+            logging.error(f"Target mode '{target_mode}' not found")
+            return False
+
         return await self._execute_transition(target_mode, reason)
 
     async def _execute_transition(self, target_mode: str, reason: str) -> bool:
@@ -357,7 +411,7 @@ class ModeManager:
 
         try:
             transition_key = f"{from_mode}->{target_mode}"
-            self.transition_cooldowns[transition_key] = time.time()
+            self.transition_cooldowns[transition_key] = time.monotonic()
 
             from_config = self.config.modes.get(from_mode)
             to_config = self.config.modes[target_mode]
@@ -436,14 +490,10 @@ class ModeManager:
         List[str]
             List of available target mode names
         """
-        available = set()
-
-        for rule in self.config.transition_rules:
-            if rule.from_mode == self.state.current_mode or rule.from_mode == "*":
-                if self._can_transition(rule):
-                    available.add(rule.to_mode)
-
-        return list(available)
+        rules = self._rules_by_mode.get(
+            self.state.current_mode, self._rules_by_mode["*"]
+        )
+        return list({rule.to_mode for rule in rules if self._can_transition(rule)})
 
     def get_mode_info(self) -> Dict:
         """
@@ -611,11 +661,17 @@ class ModeManager:
         """
         Get the path to the mode state file.
 
+        The path (and the memory folder) is resolved once and reused, since it
+        only depends on the config name.
+
         Returns
         -------
         str
             The absolute path to the state file
         """
+        if self._state_file_path is not None:
+            return self._state_file_path
+
         memory_folder_path = os.path.join(
             os.path.dirname(__file__), "../../../config", "memory"
         )
@@ -625,7 +681,8 @@ class ModeManager:
         config_name = getattr(self.config, "config_name", "default")
         state_filename = f".{config_name}.json5"
 
-        return os.path.join(memory_folder_path, state_filename)
+        self._state_file_path = os.path.join(memory_folder_path, state_filename)
+        return self._state_file_path
 
     def _load_mode_state(self):
         """
@@ -696,8 +753,11 @@ class ModeManager:
             temp_file = state_file + ".tmp"
             with open(temp_file, "w") as f:
                 json.dump(state_data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
 
-            os.rename(temp_file, state_file)
+            # Swap in the complete file so a reader never sees a partial write
+            os.replace(temp_file, state_file)
             logging.debug(f"Mode state saved to {state_file}")
 
         except Exception as e:
@@ -1,3 +1,4 @@
+import functools
 import importlib
 import inspect
 import logging
@@ -8,6 +9,7 @@ import typing as T
 from simulators.base import Simulator
 
 
+@functools.lru_cache(maxsize=None)
 def find_module_with_class(class_name: str) -> T.Optional[str]:
     """
     Find which module file contains the specified class name.
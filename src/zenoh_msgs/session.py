@@ -1,3 +1,4 @@
+import functools
 import logging
 
 import zenoh
@@ -27,6 +28,17 @@ def create_zenoh_config(network_discovery: bool = True) -> zenoh.Config:
     return config
 
 
+@functools.lru_cache(maxsize=None)
+def _shared_zenoh_config(network_discovery: bool) -> zenoh.Config:
+    """
+    Build each session configuration once per process.
+
+    zenoh.open does not consume its config, so every provider opening a
+    session reuses the same two objects.
+    """
+    return create_zenoh_config(network_discovery=network_discovery)
+
+
 def open_zenoh_session() -> zenoh.Session:
     """
     Open a Zenoh session with a local connection first, then fall back to network discovery.
@@ -41,7 +53,7 @@ def open_zenoh_session() -> zenoh.Session:
     Exception
         If unable to open a Zenoh session.
     """
-    local_config = create_zenoh_config(network_discovery=False)
+    local_config = _shared_zenoh_config(False)
     try:
         session = zenoh.open(local_config)
         logging.info("Zenoh client opened without network discovery")
@@ -50,7 +62,7 @@ def open_zenoh_session() -> zenoh.Session:
         logging.warning(f"Local connection failed: {e}")
         logging.info("Falling back to network discovery...")
 
-    config = create_zenoh_config()
+    config = _shared_zenoh_config(True)
     try:
         session = zenoh.open(config)
         logging.info("Zenoh client opened with network discovery")
@@ -1,8 +1,18 @@
 import argparse
+import logging
+import struct
+import sys
 from enum import IntEnum
 
+import numpy as np
 import serial
 
+try:
+    # Optional: JIT-compiles the CRC loop, which runs once per received frame
+    from numba import njit
+except ImportError:
+    njit = None
+
 """
 
 A parser for TBS crsf data. 
@@ -57,13 +67,30 @@ def crc8_dvb_s2(crc, a) -> int:
     return crc & 0xFF
 
 
-def crc8_data(data) -> int:
+# crc8_dvb_s2 of every possible byte, so the CRC costs one lookup per byte
+CRC8_TABLE = bytes(crc8_dvb_s2(0, i) for i in range(256))
+
+
+def _crc8_table(buf, table) -> int:
     crc = 0
-    for a in data:
-        crc = crc8_dvb_s2(crc, a)
+    for a in buf:
+        crc = table[crc ^ a]
     return crc
 
 
+if njit is not None:
+    _crc8_jit = njit(cache=True, fastmath=False)(_crc8_table)
+    _CRC8_TABLE_U8 = np.frombuffer(CRC8_TABLE, dtype=np.uint8)
+    # compile/load from cache now rather than on the first frame
+    _crc8_jit(np.zeros(1, dtype=np.uint8), _CRC8_TABLE_U8)
+
+
+def crc8_data(buf) -> int:
+    if njit is None:
+        return _crc8_table(buf, CRC8_TABLE)
+    return int(_crc8_jit(np.frombuffer(buf, dtype=np.uint8), _CRC8_TABLE_U8))
+
+
 def crsf_validate_frame(frame) -> bool:
     # print(f"\nfull frame: {frame.hex()}")
     # print(f"payload len: {len(frame[2:-1])}")
@@ -71,157 +98,241 @@ def crsf_validate_frame(frame) -> bool:
     # checksum = crc8_data(frame[2:-1])
     # print(f"CRC calculated: {hex(checksum)}")
     # print(f"CRC at data end: {hex(frame[-1])}")
-    return crc8_data(frame[2:-1]) == frame[-1]
-
-
-def signed_byte(b):
-    return b - 256 if b >= 128 else b
+    return crc8_data(memoryview(frame)[2:-1]) == frame[-1]
 
 
-def n(val):
-    # reject garbage values and noise (anything < 174 or > 1806)
+log = logging.getLogger(__name__)
 
-    res = val - 174
-    res = res / 1632
+# weights of the 11 little-endian bits that make up each RC channel
+_RC_BIT_WEIGHTS = 1 << np.arange(11)
 
-    if res > 1.0:
-        res = 1.0
-    elif res < 0.0:
-        res = 0.0
+# fixed-layout payloads, all big-endian and starting at data[3]
+_LINK_STATISTICS = struct.Struct(">bbBbBBBbBb")
+_ATTITUDE = struct.Struct(">hhh")
+_BATTERY = struct.Struct(">hh")
+_GPS = struct.Struct(">iihhhB")
+_VARIO = struct.Struct(">h")
 
-    return round(res, 2)
 
-
-def handleCrsfPacket(ptype, data):
-    if ptype == PacketsTypes.RADIO_ID and data[5] == 0x10:
+def _handle_radio_id(ptype, data):
+    if data[5] == 0x10:
         # print(f"OTX sync")
         pass
-    elif ptype == PacketsTypes.LINK_STATISTICS:
-        # LINK_STATISTICS = 0x14
-        rssi1 = signed_byte(data[3])
-        rssi2 = signed_byte(data[4])
-        lq = data[5]
-        snr = signed_byte(data[6])
-        antenna = data[7]
-        mode = data[8]
-        power = data[9]
-        # telemetry strength
-        downlink_rssi = signed_byte(data[10])
-        downlink_lq = data[11]
-        downlink_snr = signed_byte(data[12])
-        print(
-            f"RSSI={rssi1}/{rssi2}dBm LQ={lq:03} mode={mode} "
-            f"ant={antenna} snr={snr} power={power} drssi={downlink_rssi} dlq={downlink_lq} dsnr={downlink_snr}"
-        )
-    elif ptype == PacketsTypes.ATTITUDE:
-        pitch = int.from_bytes(data[3:5], byteorder="big", signed=True) / 10000.0
-        roll = int.from_bytes(data[5:7], byteorder="big", signed=True) / 10000.0
-        yaw = int.from_bytes(data[7:9], byteorder="big", signed=True) / 10000.0
-        print(f"Attitude: Pitch={pitch:0.2f} Roll={roll:0.2f} Yaw={yaw:0.2f} (rad)")
-    elif ptype == PacketsTypes.FLIGHT_MODE:
-        packet = "".join(map(chr, data[3:-2]))
-        print(f"Flight Mode: {packet}")
-    elif ptype == PacketsTypes.BATTERY_SENSOR:
-        vbat = int.from_bytes(data[3:5], byteorder="big", signed=True) / 10.0
-        curr = int.from_bytes(data[5:7], byteorder="big", signed=True) / 10.0
-        mah = data[7] << 16 | data[8] << 7 | data[9]
-        pct = data[10]
-        print(f"Battery: {vbat:0.2f}V {curr:0.1f}A {mah}mAh {pct}%")
-    elif ptype == PacketsTypes.BARO_ALT:
-        print("BaroAlt: ")
-    elif ptype == PacketsTypes.DEVICE_INFO:
-        packet = " ".join(map(hex, data))
-        print(f"Device Info: {packet}")
-    elif data[2] == PacketsTypes.GPS:
-        lat = int.from_bytes(data[3:7], byteorder="big", signed=True) / 1e7
-        lon = int.from_bytes(data[7:11], byteorder="big", signed=True) / 1e7
-        gspd = int.from_bytes(data[11:13], byteorder="big", signed=True) / 36.0
-        hdg = int.from_bytes(data[13:15], byteorder="big", signed=True) / 100.0
-        alt = int.from_bytes(data[15:17], byteorder="big", signed=True) - 1000
-        sats = data[17]
-        print(
-            f"GPS: Pos={lat} {lon} GSpd={gspd:0.1f}m/s Hdg={hdg:0.1f} Alt={alt}m Sats={sats}"
-        )
-    elif ptype == PacketsTypes.VARIO:
-        vspd = int.from_bytes(data[3:5], byteorder="big", signed=True) / 10.0
-        print(f"VSpd: {vspd:0.1f}m/s")
-    elif ptype == PacketsTypes.RC_CHANNELS_PACKED:
-        # RC_CHANNELS_PACKED = 0x16
-        packet = data[2:-1]
-        packet = packet[1:-1]  # remove type and crc
-        packet_bin_8 = ["{0:08b}".format(i)[::-1] for i in packet]  # [::-1] reverse
-        packet_bin_full = "".join(packet_bin_8)
-        packet_bin_11 = [packet_bin_full[11 * i : 11 * (i + 1)] for i in range(16)]
-        rc_packet = [int(b[::-1], 2) for b in packet_bin_11]
-
-        # sometimes there is noise in the packets - anything above a value of 2000 is garbage
-        if max(rc_packet) > 2000:
-            return
-
-        # print(f"Control packet: {rc_packet}")
-        lud = n(rc_packet[2])
-        llr = n(rc_packet[3])
-        rud = n(rc_packet[0])
-        rlr = n(rc_packet[1])
-        swA = n(rc_packet[4])
-        swA = "in" if swA > 0.6 else "off"
-        swB = n(rc_packet[5])
-        swB = "front" if swB <= 0.33 else "back" if swB >= 0.66 else "middle"
-        swC = n(rc_packet[6])
-        swC = "front" if swC <= 0.33 else "back" if swC >= 0.66 else "middle"
-        swD = n(rc_packet[7])
-        swD = "in" if swD > 0.6 else "off"
-        swE = n(rc_packet[8])
-        swE = "on" if swE > 0.6 else "off"
-        swF = n(rc_packet[9])
-        swF = "on" if swF > 0.6 else "off"
-        print(
-            f"LUD:{lud},LLR:{llr},RUD:{rud},RLR:{rlr},SWA:{swA},SWB:{swB},SWC:{swC},SWD:{swD},SWE:{swE},SWF:{swF}"
-        )
-    elif ptype == PacketsTypes.PARAMETER_PING:
-        packet = " ".join(map(hex, data))
-        print(f"PING 0x{ptype:02x}: {packet}")
     else:
-        packet = " ".join(map(hex, data))
-        print(f"Unknown 0x{ptype:02x}: {packet}")
-
-
-parser = argparse.ArgumentParser()
-parser.add_argument(
-    "-P", "--port", default="/dev/cu.usbserial-B003ABY3", required=False
-)
-parser.add_argument("-b", "--baud", default=420000, required=False)
-parser.add_argument(
-    "-t",
-    "--tx",
-    required=False,
-    default=False,
-    action="store_true",
-    help="Enable sending CHANNELS_PACKED every 20ms (all channels 1500us)",
-)
-args = parser.parse_args()
-
-with serial.Serial(
-    args.port,
-    args.baud,
-    timeout=1,
-) as ser:
-    input = bytearray()
-    while True:
-        if ser.in_waiting > 0:
-            input.extend(ser.read(ser.in_waiting))
-        while len(input) > 2:
-            expected_len = input[1] + 2
+        _handle_unknown(ptype, data)
+
+
+def _handle_link_stats(ptype, data):
+    # LINK_STATISTICS = 0x14
+    if not log.isEnabledFor(logging.DEBUG):
+        return
+    (
+        rssi1,
+        rssi2,
+        lq,
+        snr,
+        antenna,
+        mode,
+        power,
+        # telemetry strength
+        downlink_rssi,
+        downlink_lq,
+        downlink_snr,
+    ) = _LINK_STATISTICS.unpack_from(data, 3)
+    log.debug(
+        "RSSI=%s/%sdBm LQ=%03d mode=%s ant=%s snr=%s power=%s drssi=%s dlq=%s dsnr=%s",
+        rssi1,
+        rssi2,
+        lq,
+        mode,
+        antenna,
+        snr,
+        power,
+        downlink_rssi,
+        downlink_lq,
+        downlink_snr,
+    )
+
+
+def _handle_attitude(ptype, data):
+    pitch, roll, yaw = _ATTITUDE.unpack_from(data, 3)
+    pitch /= 10000.0
+    roll /= 10000.0
+    yaw /= 10000.0
+    print(f"Attitude: Pitch={pitch:0.2f} Roll={roll:0.2f} Yaw={yaw:0.2f} (rad)")
+
+
+def _handle_flight_mode(ptype, data):
+    packet = "".join(map(chr, data[3:-2]))
+    print(f"Flight Mode: {packet}")
+
+
+def _handle_battery(ptype, data):
+    vbat, curr = _BATTERY.unpack_from(data, 3)
+    vbat /= 10.0
+    curr /= 10.0
+    mah = data[7] << 16 | data[8] << 7 | data[9]
+    pct = data[10]
+    print(f"Battery: {vbat:0.2f}V {curr:0.1f}A {mah}mAh {pct}%")
+
+
+def _handle_baro_alt(ptype, data):
+    print("BaroAlt: ")
+
+
+def _handle_device_info(ptype, data):
+    packet = " ".join(map(hex, data))
+    print(f"Device Info: {packet}")
+
+
+def _handle_gps(ptype, data):
+    lat, lon, gspd, hdg, alt, sats = _GPS.unpack_from(data, 3)
+    lat /= 1e7
+    lon /= 1e7
+    gspd /= 36.0
+    hdg /= 100.0
+    alt -= 1000
+    print(
+        f"GPS: Pos={lat} {lon} GSpd={gspd:0.1f}m/s Hdg={hdg:0.1f} Alt={alt}m Sats={sats}"
+    )
+
+
+def _handle_vario(ptype, data):
+    vspd = _VARIO.unpack_from(data, 3)[0] / 10.0
+    print(f"VSpd: {vspd:0.1f}m/s")
+
+
+def decode_rc_channels(data):
+    # unpack the 22-byte RC_CHANNELS_PACKED payload into 16 11-bit channels
+    packet = np.frombuffer(data, dtype=np.uint8)[3:-1]  # remove header and crc
+    bits = np.unpackbits(packet, bitorder="little")[: 16 * 11].reshape(16, 11)
+    return bits @ _RC_BIT_WEIGHTS
+
+
+def _handle_rc_channels(ptype, data):
+    # RC_CHANNELS_PACKED = 0x16
+    # the most frequent packet; decoding only feeds the debug output below
+    if not log.isEnabledFor(logging.DEBUG):
+        return
+    rc_packet = decode_rc_channels(data)
+
+    # sometimes there is noise in the packets - anything above a value of 2000 is garbage
+    if rc_packet.max() > 2000:
+        return
+
+    # print(f"Control packet: {rc_packet}")
+    # normalize 174..1806 to 0..1, clamping garbage values and noise
+    scaled = np.round(np.clip((rc_packet - 174) / 1632, 0.0, 1.0), 2).tolist()
+    rud, rlr, lud, llr, swA, swB, swC, swD, swE, swF = scaled[:10]
+    swA = "in" if swA > 0.6 else "off"
+    swB = "front" if swB <= 0.33 else "back" if swB >= 0.66 else "middle"
+    swC = "front" if swC <= 0.33 else "back" if swC >= 0.66 else "middle"
+    swD = "in" if swD > 0.6 else "off"
+    swE = "on" if swE > 0.6 else "off"
+    swF = "on" if swF > 0.6 else "off"
+    log.debug(
+        "LUD:%s,LLR:%s,RUD:%s,RLR:%s,SWA:%s,SWB:%s,SWC:%s,SWD:%s,SWE:%s,SWF:%s",
+        lud,
+        llr,
+        rud,
+        rlr,
+        swA,
+        swB,
+        swC,
+        swD,
+        swE,
+        swF,
+    )
+
+
+def _handle_parameter_ping(ptype, data):
+    packet = " ".join(map(hex, data))
+    print(f"PING 0x{ptype:02x}: {packet}")
+
+
+def _handle_unknown(ptype, data):
+    packet = " ".join(map(hex, data))
+    print(f"Unknown 0x{ptype:02x}: {packet}")
+
+
+# keyed by the raw int packet type, so dispatch is a single dict lookup
+_HANDLERS = {
+    int(PacketsTypes.RADIO_ID): _handle_radio_id,
+    int(PacketsTypes.LINK_STATISTICS): _handle_link_stats,
+    int(PacketsTypes.ATTITUDE): _handle_attitude,
+    int(PacketsTypes.FLIGHT_MODE): _handle_flight_mode,
+    int(PacketsTypes.BATTERY_SENSOR): _handle_battery,
+    int(PacketsTypes.BARO_ALT): _handle_baro_alt,
+    int(PacketsTypes.DEVICE_INFO): _handle_device_info,
+    int(PacketsTypes.GPS): _handle_gps,
+    int(PacketsTypes.VARIO): _handle_vario,
+    int(PacketsTypes.RC_CHANNELS_PACKED): _handle_rc_channels,
+    int(PacketsTypes.PARAMETER_PING): _handle_parameter_ping,
+}
+
+
+def handleCrsfPacket(ptype, data):
+    _HANDLERS.get(ptype, _handle_unknown)(ptype, data)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-P", "--port", default="/dev/cu.usbserial-B003ABY3", required=False
+    )
+    parser.add_argument("-b", "--baud", default=420000, required=False)
+    parser.add_argument(
+        "-t",
+        "--tx",
+        required=False,
+        default=False,
+        action="store_true",
+        help="Enable sending CHANNELS_PACKED every 20ms (all channels 1500us)",
+    )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        required=False,
+        default=False,
+        action="store_true",
+        help="Skip decoding and printing the high-rate RC_CHANNELS and LINK_STATISTICS packets",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO if args.quiet else logging.DEBUG,
+        format="%(message)s",
+        stream=sys.stdout,
+    )
+
+    # Block in the driver for each part of a frame instead of busy-polling
+    # in_waiting; the short timeout keeps the loop responsive to Ctrl-C.
+    with serial.Serial(
+        args.port,
+        args.baud,
+        timeout=0.05,
+    ) as ser:
+        while True:
+            sync = ser.read(1)
+            if not sync or sync[0] != PacketsTypes.SYNC_BYTE:
+                continue
+            length = ser.read(1)
+            if not length:
+                continue
+            # the length byte counts the type, payload and crc bytes
+            expected_len = length[0] + 2
             if expected_len > 64 or expected_len < 4:
-                input = bytearray()
-            elif len(input) >= expected_len:
-                single = input[:expected_len]  # copy out this whole packet
-                input = input[expected_len:]  # and remove it from the buffer
-                if single[0] == PacketsTypes.SYNC_BYTE:
-                    if not crsf_validate_frame(single):
-                        packet = " ".join(map(hex, single))
-                        print(f"crc error: {packet}")
-                    else:
-                        handleCrsfPacket(single[2], single)
+                continue
+            body = ser.read(length[0])
+            if len(body) < length[0]:
+                continue
+            single = bytearray(sync + length + body)
+            if not crsf_validate_frame(single):
+                packet = " ".join(map(hex, single))
+                print(f"crc error: {packet}")
             else:
-                break
+                handleCrsfPacket(single[2], single)
+
+
+if __name__ == "__main__":
+    main()
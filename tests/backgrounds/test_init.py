@@ -1,4 +1,4 @@
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import MagicMock, Mock, mock_open, patch
 
 import pytest
 
@@ -11,6 +11,27 @@ class MockBackground(Background):
         pass
 
 
+@pytest.fixture(autouse=True)
+def clear_find_module_cache():
+    find_module_with_class.cache_clear()
+    yield
+    find_module_with_class.cache_clear()
+
+
+def mock_scandir(*file_names):
+    entries = []
+    for file_name in file_names:
+        entry = Mock()
+        entry.name = file_name
+        entry.path = f"plugins/{file_name}"
+        entry.is_file.return_value = True
+        entries.append(entry)
+
+    scandir = MagicMock()
+    scandir.return_value.__enter__.return_value = entries
+    return scandir
+
+
 def test_load_background_success():
     with (
         patch("backgrounds.find_module_with_class") as mock_find_module,
@@ -80,15 +101,14 @@ def test_find_module_with_class_success():
     with (
         patch("os.path.join") as mock_join,
         patch("os.path.exists") as mock_exists,
-        patch("os.listdir") as mock_listdir,
+        patch("os.scandir", mock_scandir("test_background.py")),
         patch(
             "builtins.open",
-            mock_open(read_data="class TestBackground(Background):\n    pass\n"),
+            mock_open(read_data=b"class TestBackground(Background):\n    pass\n"),
         ),
     ):
         mock_join.side_effect = lambda *args: "/".join(args)
         mock_exists.return_value = True
-        mock_listdir.return_value = ["test_background.py"]
 
         result = find_module_with_class("TestBackground")
 
@@ -99,12 +119,11 @@ def test_find_module_with_class_not_found():
     with (
         patch("os.path.join") as mock_join,
         patch("os.path.exists") as mock_exists,
-        patch("os.listdir") as mock_listdir,
-        patch("builtins.open", mock_open(read_data="class OtherClass:\n    pass\n")),
+        patch("os.scandir", mock_scandir("other_file.py")),
+        patch("builtins.open", mock_open(read_data=b"class OtherClass:\n    pass\n")),
     ):
         mock_join.side_effect = lambda *args: "/".join(args)
         mock_exists.return_value = True
-        mock_listdir.return_value = ["other_file.py"]
 
         result = find_module_with_class("TestBackground")
 
@@ -1,9 +1,11 @@
 import json
 import os
+from functools import lru_cache
 
 import json5
 import pytest
-from jsonschema import ValidationError, validate
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import best_match
 
 json_dir = os.path.join(os.path.dirname(__file__), "../../config")
 
@@ -22,10 +24,26 @@ def multi_mode_schema():
         return json.load(f)
 
 
+@pytest.fixture(scope="session")
+def single_mode_validator(single_mode_schema):
+    Draft7Validator.check_schema(single_mode_schema)
+    return Draft7Validator(single_mode_schema)
+
+
+@pytest.fixture(scope="session")
+def multi_mode_validator(multi_mode_schema):
+    Draft7Validator.check_schema(multi_mode_schema)
+    return Draft7Validator(multi_mode_schema)
+
+
+@lru_cache(maxsize=None)
 def get_all_json_files():
-    return [
-        os.path.join(json_dir, f) for f in os.listdir(json_dir) if f.endswith(".json5")
-    ]
+    # sorted so every xdist worker collects the same parametrization order
+    return tuple(
+        os.path.join(json_dir, f)
+        for f in sorted(os.listdir(json_dir))
+        if f.endswith(".json5")
+    )
 
 
 def is_mode_config(data):
@@ -33,14 +51,15 @@ def is_mode_config(data):
     return "modes" in data and "default_mode" in data
 
 
+# Each config file validates independently, so with pytest-xdist the cases
+# shard across workers: `uv run pytest -n auto tests/config/schema_test.py`
 @pytest.mark.parametrize("json_file", get_all_json_files())
-def test_json_file_valid(json_file, single_mode_schema, multi_mode_schema):
+def test_json_file_valid(json_file, single_mode_validator, multi_mode_validator):
     with open(json_file) as f:
         data = json5.load(f)
 
-    schema = multi_mode_schema if is_mode_config(data) else single_mode_schema
+    validator = multi_mode_validator if is_mode_config(data) else single_mode_validator
 
-    try:
-        validate(instance=data, schema=schema)
-    except ValidationError as e:
-        pytest.fail(f"{json_file} failed validation: {e.message}")
+    error = best_match(validator.iter_errors(data))
+    if error is not None:
+        pytest.fail(f"{json_file} failed validation: {error.message}")
@@ -0,0 +1,23 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def mock_asr_provider():
+    with patch("inputs.plugins.google_asr.ASRProvider") as mock:
+        mock_instance = Mock()
+        mock.return_value = mock_instance
+        yield mock
+
+
+@pytest.fixture(scope="module")
+def mock_sleep_ticker():
+    with patch("inputs.plugins.google_asr.SleepTickerProvider") as mock:
+        yield mock
+
+
+@pytest.fixture(scope="module")
+def mock_conversation():
+    with patch("inputs.plugins.google_asr.TeleopsConversationProvider") as mock:
+        yield mock
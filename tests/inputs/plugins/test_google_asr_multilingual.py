@@ -1,134 +1,74 @@
-from unittest.mock import Mock, patch
-
 import pytest
 
 from inputs.base import SensorConfig
 from inputs.plugins.google_asr import LANGUAGE_CODE_MAP, GoogleASRInput
 
+# GoogleASRInput only reads its config, so one instance per language is shared
+LANGUAGE_CONFIGS = {
+    language: SensorConfig(api_key="test_key", language=language)
+    for language in ("korean", "spanish", "japanese", "KOREAN", "  korean  ")
+}
 
-@pytest.fixture
-def mock_asr_provider():
-    with patch("inputs.plugins.google_asr.ASRProvider") as mock:
-        mock_instance = Mock()
-        mock.return_value = mock_instance
-        yield mock
-
-
-@pytest.fixture
-def mock_sleep_ticker():
-    with patch("inputs.plugins.google_asr.SleepTickerProvider") as mock:
-        yield mock
 
-
-@pytest.fixture
-def mock_conversation():
-    with patch("inputs.plugins.google_asr.TeleopsConversationProvider") as mock:
-        yield mock
+@pytest.fixture(autouse=True)
+def reset_asr_mocks(mock_asr_provider, mock_sleep_ticker, mock_conversation):
+    # the patches live for the whole module; only the recorded calls are reset
+    mock_asr_provider.reset_mock()
+    mock_sleep_ticker.reset_mock()
+    mock_conversation.reset_mock()
 
 
 def test_language_code_map_contains_required_languages():
     """Test that language code map has all required languages."""
-    required_languages = [
+    required_languages = {
         "english",
         "chinese",
         "german",
         "french",
         "japanese",
         "korean",
-    ]
-    for lang in required_languages:
-        assert lang in LANGUAGE_CODE_MAP
-
-
-def test_korean_language_code():
-    """Test that Korean language has correct code."""
-    assert LANGUAGE_CODE_MAP["korean"] == "ko-KR"
-
-
-def test_spanish_language_code():
-    """Test that Spanish language has correct code."""
-    assert LANGUAGE_CODE_MAP["spanish"] == "es-ES"
-
-
-def test_italian_language_code():
-    """Test that Italian language has correct code."""
-    assert LANGUAGE_CODE_MAP["italian"] == "it-IT"
+    }
+    missing = required_languages - LANGUAGE_CODE_MAP.keys()
+    assert not missing, f"Missing languages: {missing}"
+
+
+@pytest.mark.parametrize(
+    "lang,code",
+    [
+        ("korean", "ko-KR"),
+        ("spanish", "es-ES"),
+        ("italian", "it-IT"),
+        ("portuguese", "pt-BR"),
+        ("russian", "ru-RU"),
+        ("arabic", "ar-SA"),
+    ],
+)
+def test_language_code(lang, code):
+    """Test that each language has the correct code."""
+    assert LANGUAGE_CODE_MAP[lang] == code
+
+
+@pytest.mark.parametrize(
+    "language_input,expected_code",
+    [
+        ("korean", "ko-KR"),
+        ("spanish", "es-ES"),
+        ("japanese", "ja-JP"),
+        # language names are case-insensitive
+        ("KOREAN", "ko-KR"),
+        # language names handle whitespace
+        ("  korean  ", "ko-KR"),
+    ],
+)
+def test_init_with_language(language_input, expected_code, mock_asr_provider):
+    """Test ASR initialization passes the matching language code."""
+    _ = GoogleASRInput(config=LANGUAGE_CONFIGS[language_input])
 
-
-def test_portuguese_language_code():
-    """Test that Portuguese language has correct code."""
-    assert LANGUAGE_CODE_MAP["portuguese"] == "pt-BR"
-
-
-def test_russian_language_code():
-    """Test that Russian language has correct code."""
-    assert LANGUAGE_CODE_MAP["russian"] == "ru-RU"
-
-
-def test_arabic_language_code():
-    """Test that Arabic language has correct code."""
-    assert LANGUAGE_CODE_MAP["arabic"] == "ar-SA"
-
-
-def test_init_with_korean_language(
-    mock_asr_provider, mock_sleep_ticker, mock_conversation
-):
-    """Test ASR initialization with Korean language."""
-    config = SensorConfig(api_key="test_key", language="korean")
-    _ = GoogleASRInput(config=config)
-
-    # Verify ASR provider was called with Korean language code
     call_args = mock_asr_provider.call_args
-    assert call_args[1]["language_code"] == "ko-KR"
+    assert call_args[1]["language_code"] == expected_code
 
 
-def test_init_with_spanish_language(
-    mock_asr_provider, mock_sleep_ticker, mock_conversation
-):
-    """Test ASR initialization with Spanish language."""
-    config = SensorConfig(api_key="test_key", language="spanish")
-    _ = GoogleASRInput(config=config)
-
-    call_args = mock_asr_provider.call_args
-    assert call_args[1]["language_code"] == "es-ES"
-
-
-def test_init_with_japanese_language(
-    mock_asr_provider, mock_sleep_ticker, mock_conversation
-):
-    """Test ASR initialization with Japanese language."""
-    config = SensorConfig(api_key="test_key", language="japanese")
-    _ = GoogleASRInput(config=config)
-
-    call_args = mock_asr_provider.call_args
-    assert call_args[1]["language_code"] == "ja-JP"
-
-
-def test_init_with_case_insensitive_language(
-    mock_asr_provider, mock_sleep_ticker, mock_conversation
-):
-    """Test that language names are case-insensitive."""
-    config = SensorConfig(api_key="test_key", language="KOREAN")
-    _ = GoogleASRInput(config=config)
-
-    call_args = mock_asr_provider.call_args
-    assert call_args[1]["language_code"] == "ko-KR"
-
-
-def test_init_with_whitespace_in_language(
-    mock_asr_provider, mock_sleep_ticker, mock_conversation
-):
-    """Test that language names handle whitespace."""
-    config = SensorConfig(api_key="test_key", language="  korean  ")
-    _ = GoogleASRInput(config=config)
-
-    call_args = mock_asr_provider.call_args
-    assert call_args[1]["language_code"] == "ko-KR"
-
-
-def test_init_with_unsupported_language_defaults_to_english(
-    mock_asr_provider, mock_sleep_ticker, mock_conversation, caplog
-):
+def test_init_with_unsupported_language_defaults_to_english(mock_asr_provider, caplog):
     """Test that unsupported language defaults to English with warning."""
     config = SensorConfig(api_key="test_key", language="klingon")
     _ = GoogleASRInput(config=config)
@@ -138,9 +78,7 @@ def test_init_with_unsupported_language_defaults_to_english(
     assert "not supported" in caplog.text
 
 
-def test_init_without_language_defaults_to_english(
-    mock_asr_provider, mock_sleep_ticker, mock_conversation
-):
+def test_init_without_language_defaults_to_english(mock_asr_provider):
     """Test that missing language config defaults to English."""
     config = SensorConfig(api_key="test_key")
     _ = GoogleASRInput(config=config)
@@ -151,9 +89,11 @@ def test_init_without_language_defaults_to_english(
 
 def test_all_language_codes_are_valid_format():
     """Test that all language codes follow proper format."""
-    for lang_code in LANGUAGE_CODE_MAP.values():
-        # Google language codes are typically xx-XX or xxx-Xxxx-XX format
-        assert "-" in lang_code or len(lang_code) >= 2
+    # Google language codes are typically xx-XX or xxx-Xxxx-XX format
+    invalid = [
+        code for code in LANGUAGE_CODE_MAP.values() if "-" not in code and len(code) < 2
+    ]
+    assert not invalid, f"Invalid language codes: {invalid}"
 
 
 def test_language_map_has_no_duplicates():
@@ -6,6 +6,13 @@ from inputs import find_module_with_class, load_input
 from inputs.base import Sensor
 
 
+@pytest.fixture(autouse=True)
+def clear_find_module_cache():
+    find_module_with_class.cache_clear()
+    yield
+    find_module_with_class.cache_clear()
+
+
 class MockInput(Sensor):
     async def raw_to_text(self, raw_input):
         pass
@@ -14,110 +21,84 @@ class MockInput(Sensor):
         return None
 
 
-def test_load_input_success():
-    with (
-        patch("inputs.find_module_with_class") as mock_find_module,
-        patch("importlib.import_module") as mock_import,
-    ):
-        mock_find_module.return_value = "mock_input"
-        mock_module = Mock()
-        mock_module.MockInput = MockInput
-        mock_import.return_value = mock_module
-
-        result = load_input("MockInput")
-
-        mock_find_module.assert_called_once_with("MockInput")
-        mock_import.assert_called_once_with("inputs.plugins.mock_input")
-        assert result == MockInput
-
-
-def test_load_input_not_found():
-    with patch("inputs.find_module_with_class") as mock_find_module:
-        mock_find_module.return_value = None
-
-        with pytest.raises(
-            ValueError,
-            match="Class 'NonexistentInput' not found in any input plugin module",
-        ):
-            load_input("NonexistentInput")
-
-
-def test_load_input_multiple_plugins():
-    with (
-        patch("inputs.find_module_with_class") as mock_find_module,
-        patch("importlib.import_module") as mock_import,
+@pytest.mark.parametrize(
+    "class_name, module_name, input_class",
+    [
+        ("MockInput", "mock_input", MockInput),
+        ("Input2", "input2", type("Input2", (Sensor,), {})),
+    ],
+    ids=["single_plugin", "multiple_plugins"],
+)
+@patch("importlib.import_module")
+@patch("inputs.find_module_with_class")
+def test_load_input_success(
+    mock_find_module, mock_import, class_name, module_name, input_class
+):
+    mock_find_module.return_value = module_name
+    mock_module = Mock()
+    setattr(mock_module, class_name, input_class)
+    mock_import.return_value = mock_module
+
+    result = load_input(class_name)
+
+    mock_find_module.assert_called_once_with(class_name)
+    mock_import.assert_called_once_with(f"inputs.plugins.{module_name}")
+    assert result == input_class
+
+
+@patch("inputs.find_module_with_class")
+def test_load_input_not_found(mock_find_module):
+    mock_find_module.return_value = None
+
+    with pytest.raises(
+        ValueError,
+        match="Class 'NonexistentInput' not found in any input plugin module",
     ):
-        mock_find_module.return_value = "input2"
-        mock_module2 = Mock()
-        mock_module2.Input2 = type("Input2", (Sensor,), {})
-        mock_import.return_value = mock_module2
+        load_input("NonexistentInput")
 
-        result = load_input("Input2")
 
-        mock_find_module.assert_called_once_with("Input2")
-        mock_import.assert_called_once_with("inputs.plugins.input2")
-        assert result == mock_module2.Input2
+@patch("importlib.import_module")
+@patch("inputs.find_module_with_class")
+def test_load_input_invalid_type(mock_find_module, mock_import):
+    mock_find_module.return_value = "invalid_input"
 
+    class InvalidInput:
+        pass
 
-def test_load_input_invalid_type():
-    with (
-        patch("inputs.find_module_with_class") as mock_find_module,
-        patch("importlib.import_module") as mock_import,
-    ):
-        mock_find_module.return_value = "invalid_input"
-
-        class InvalidInput:
-            pass
-
-        mock_module = Mock()
-        mock_module.InvalidInput = InvalidInput
-        mock_import.return_value = mock_module
-
-        with pytest.raises(
-            ValueError, match="'InvalidInput' is not a valid input subclass"
-        ):
-            load_input("InvalidInput")
-
-
-def test_find_module_with_class_success():
-    with (
-        patch("os.path.join") as mock_join,
-        patch("os.path.exists") as mock_exists,
-        patch("os.listdir") as mock_listdir,
-        patch(
-            "builtins.open",
-            mock_open(read_data="class TestInput(FuserInput):\n    pass\n"),
-        ),
-    ):
-        mock_join.side_effect = lambda *args: "/".join(args)
-        mock_exists.return_value = True
-        mock_listdir.return_value = ["test_input.py"]
-
-        result = find_module_with_class("TestInput")
-
-        assert result == "test_input"
-
+    mock_module = Mock()
+    mock_module.InvalidInput = InvalidInput
+    mock_import.return_value = mock_module
 
-def test_find_module_with_class_not_found():
-    with (
-        patch("os.path.join") as mock_join,
-        patch("os.path.exists") as mock_exists,
-        patch("os.listdir") as mock_listdir,
-        patch("builtins.open", mock_open(read_data="class OtherClass:\n    pass\n")),
+    with pytest.raises(
+        ValueError, match="'InvalidInput' is not a valid input subclass"
     ):
-        mock_join.side_effect = lambda *args: "/".join(args)
-        mock_exists.return_value = True
-        mock_listdir.return_value = ["other_file.py"]
-
+        load_input("InvalidInput")
+
+
+@pytest.mark.parametrize(
+    "filename, source, expected",
+    [
+        ("test_input.py", "class TestInput(FuserInput):\n    pass\n", "test_input"),
+        ("other_file.py", "class OtherClass:\n    pass\n", None),
+    ],
+    ids=["found", "not_found"],
+)
+@patch("os.listdir")
+@patch("os.path.exists")
+def test_find_module_with_class(mock_exists, mock_listdir, filename, source, expected):
+    mock_exists.return_value = True
+    mock_listdir.return_value = [filename]
+
+    with patch("builtins.open", mock_open(read_data=source)):
         result = find_module_with_class("TestInput")
 
-        assert result is None
+    assert result == expected
 
 
-def test_find_module_with_class_no_plugins_dir():
-    with patch("os.path.exists") as mock_exists:
-        mock_exists.return_value = False
+@patch("os.path.exists")
+def test_find_module_with_class_no_plugins_dir(mock_exists):
+    mock_exists.return_value = False
 
-        result = find_module_with_class("TestInput")
+    result = find_module_with_class("TestInput")
 
-        assert result is None
+    assert result is None
@@ -1,54 +1,54 @@
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from pydantic import BaseModel
 
 from llm import LLMConfig
 from llm.output_model import Action, CortexOutputModel
-from llm.plugins.deepseek_llm import DeepSeekLLM
 
 
-class DummyOutputModel(BaseModel):
-    test_field: str
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config():
     return LLMConfig(base_url="test_url/", api_key="test_key", model="test_model")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_response():
     """Fixture providing a valid mock API response"""
-    response = MagicMock()
-    response.choices = [
-        MagicMock(
-            message=MagicMock(content='{"test_field": "success"}', tool_calls=None)
-        )
-    ]
-    return response
+    return SimpleNamespace(
+        choices=[
+            SimpleNamespace(
+                message=SimpleNamespace(
+                    content='{"test_field": "success"}', tool_calls=None
+                )
+            )
+        ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_response_with_tool_calls():
     """Fixture providing a mock API response with tool calls"""
-    tool_call = MagicMock()
-    tool_call.function.name = "test_function"
-    tool_call.function.arguments = '{"arg1": "value1"}'
-
-    response = MagicMock()
-    response.choices = [
-        MagicMock(
-            message=MagicMock(
-                content='{"test_field": "success"}', tool_calls=[tool_call]
+    tool_call = SimpleNamespace(
+        function=SimpleNamespace(name="test_function", arguments='{"arg1": "value1"}')
+    )
+
+    return SimpleNamespace(
+        choices=[
+            SimpleNamespace(
+                message=SimpleNamespace(
+                    content='{"test_field": "success"}', tool_calls=[tool_call]
+                )
             )
-        )
-    ]
-    return response
+        ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def llm(config):
+    # imported here so collecting this module does not load the openai SDK
+    from llm.plugins.deepseek_llm import DeepSeekLLM
+
     return DeepSeekLLM(config, available_actions=None)
 
 
@@ -63,82 +63,79 @@ async def test_init_with_config(llm, config):
 @pytest.mark.asyncio
 async def test_init_empty_key():
     """Test fallback API key when no credentials provided"""
+    from llm.plugins.deepseek_llm import DeepSeekLLM
+
     config = LLMConfig(base_url="test_url")
     with pytest.raises(ValueError, match="config file missing api_key"):
         DeepSeekLLM(config, available_actions=None)
 
 
 @pytest.mark.asyncio
-async def test_ask_success(llm, mock_response):
+async def test_ask_success(llm, mock_response, monkeypatch):
     """Test successful API request and response parsing"""
-    with pytest.MonkeyPatch.context() as m:
-        m.setattr(
-            llm._client.chat.completions,
-            "create",
-            AsyncMock(return_value=mock_response),
-        )
+    monkeypatch.setattr(
+        llm._client.chat.completions,
+        "create",
+        AsyncMock(return_value=mock_response),
+    )
 
-        result = await llm.ask("test prompt")
-        assert result is None
+    result = await llm.ask("test prompt")
+    assert result is None
 
 
 @pytest.mark.asyncio
-async def test_ask_with_tool_calls(llm, mock_response_with_tool_calls):
+async def test_ask_with_tool_calls(llm, mock_response_with_tool_calls, monkeypatch):
     """Test successful API request with tool calls"""
-    with pytest.MonkeyPatch.context() as m:
-        m.setattr(
-            llm._client.chat.completions,
-            "create",
-            AsyncMock(return_value=mock_response_with_tool_calls),
-        )
+    monkeypatch.setattr(
+        llm._client.chat.completions,
+        "create",
+        AsyncMock(return_value=mock_response_with_tool_calls),
+    )
 
-        result = await llm.ask("test prompt")
-        assert isinstance(result, CortexOutputModel)
-        assert result.actions == [Action(type="test_function", value="value1")]
+    result = await llm.ask("test prompt")
+    assert isinstance(result, CortexOutputModel)
+    assert result.actions == [Action(type="test_function", value="value1")]
 
 
 @pytest.mark.asyncio
-async def test_ask_invalid_json(llm):
+async def test_ask_invalid_json(llm, monkeypatch):
     """Test handling of invalid JSON response"""
     invalid_response = MagicMock()
     invalid_response.choices = [MagicMock(message=MagicMock(content="invalid"))]
 
-    with pytest.MonkeyPatch.context() as m:
-        m.setattr(
-            llm._client.chat.completions,
-            "create",
-            AsyncMock(return_value=invalid_response),
-        )
+    monkeypatch.setattr(
+        llm._client.chat.completions,
+        "create",
+        AsyncMock(return_value=invalid_response),
+    )
 
-        result = await llm.ask("test prompt")
-        assert result == CortexOutputModel(actions=[])
+    result = await llm.ask("test prompt")
+    assert result == CortexOutputModel(actions=[])
 
 
 @pytest.mark.asyncio
-async def test_ask_api_error(llm):
+async def test_ask_api_error(llm, monkeypatch):
     """Test error handling for API exceptions"""
-    with pytest.MonkeyPatch.context() as m:
-        m.setattr(
-            llm._client.chat.completions,
-            "create",
-            AsyncMock(side_effect=Exception("API error")),
-        )
+    monkeypatch.setattr(
+        llm._client.chat.completions,
+        "create",
+        AsyncMock(side_effect=Exception("API error")),
+    )
 
-        result = await llm.ask("test prompt")
-        assert result is None
+    result = await llm.ask("test prompt")
+    assert result is None
 
 
 @pytest.mark.asyncio
-async def test_io_provider_timing(llm, mock_response):
+async def test_io_provider_timing(llm, mock_response, monkeypatch):
     """Test timing metrics collection"""
-    with pytest.MonkeyPatch.context() as m:
-        m.setattr(
-            llm._client.chat.completions,
-            "create",
-            AsyncMock(return_value=mock_response),
-        )
-
-        await llm.ask("test prompt")
-        assert llm.io_provider.llm_start_time is not None
-        assert llm.io_provider.llm_end_time is not None
-        assert llm.io_provider.llm_end_time >= llm.io_provider.llm_start_time
+    monkeypatch.setattr(
+        llm._client.chat.completions,
+        "create",
+        AsyncMock(return_value=mock_response),
+    )
+
+    await llm.ask("test prompt")
+    assert llm.io_provider.llm_start_time is not None
+    assert llm.io_provider.llm_end_time is not None
+    assert llm.io_provider.llm_end_time >= llm.io_provider.llm_start_time
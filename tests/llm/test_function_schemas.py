@@ -32,17 +32,17 @@ class SampleConnector(ActionConnector[SampleOutput]):
         self.last_output = input_protocol
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def action_config():
     return ActionConfig(param1="test_value", param2=123)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_connector(action_config):
     return SampleConnector(action_config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def agent_action(test_connector):
     return AgentAction(
         name="test_action",
@@ -75,3 +75,9 @@ def test_generate_function_schema_from_action(agent_action):
 
     assert params["required"] == ["value"]
     assert fn["description"].startswith("SampleInterface(")
+
+
+def test_generate_function_schema_from_action_is_memoized(agent_action):
+    schema = generate_function_schema_from_action(agent_action)
+
+    assert generate_function_schema_from_action(agent_action) is schema
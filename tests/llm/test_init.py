@@ -5,11 +5,13 @@ from pydantic import BaseModel
 
 from llm import LLM, LLMConfig, find_module_with_class, load_llm
 from providers.io_provider import IOProvider
-from runtime.single_mode.config import add_meta
 
 
-class DummyOutputModel(BaseModel):
-    test_field: str
+@pytest.fixture(autouse=True)
+def clear_find_module_cache():
+    find_module_with_class.cache_clear()
+    yield
+    find_module_with_class.cache_clear()
 
 
 class MockLLM(LLM[BaseModel]):
@@ -29,7 +31,7 @@ def base_llm(config):
 
 def test_llm_init(base_llm, config):
     assert base_llm._config == config
-    assert isinstance(base_llm.io_provider, type(IOProvider()))
+    assert base_llm.io_provider is IOProvider()
 
 
 @pytest.mark.asyncio
@@ -39,6 +41,9 @@ async def test_llm_ask_not_implemented(base_llm):
 
 
 def test_llm_config():
+    # runtime config pulls in every plugin package, so only load it here
+    from runtime.single_mode.config import add_meta
+
     llm_config = LLMConfig(
         **add_meta(  # type: ignore
             {
@@ -57,90 +62,72 @@ def test_llm_config():
         llm_config.invalid_key  # type: ignore
 
 
-def test_load_llm_mock_implementation():
-    with (
-        patch("llm.find_module_with_class") as mock_find_module,
-        patch("importlib.import_module") as mock_import,
-    ):
-        mock_find_module.return_value = "mock_llm"
-        mock_module = Mock()
-        mock_module.MockLLM = MockLLM
-        mock_import.return_value = mock_module
-
-        result = load_llm("MockLLM")
-
-        mock_find_module.assert_called_once_with("MockLLM")
-        mock_import.assert_called_once_with("llm.plugins.mock_llm")
-        assert result == MockLLM
+@patch("importlib.import_module")
+@patch("llm.find_module_with_class")
+def test_load_llm_mock_implementation(mock_find_module, mock_import):
+    mock_find_module.return_value = "mock_llm"
+    mock_module = Mock()
+    mock_module.MockLLM = MockLLM
+    mock_import.return_value = mock_module
 
+    result = load_llm("MockLLM")
 
-def test_load_llm_not_found():
-    with patch("llm.find_module_with_class") as mock_find_module:
-        mock_find_module.return_value = None
+    mock_find_module.assert_called_once_with("MockLLM")
+    mock_import.assert_called_once_with("llm.plugins.mock_llm")
+    assert result == MockLLM
 
-        with pytest.raises(
-            ValueError,
-            match="Class 'NonexistentLLM' not found in any LLM plugin module",
-        ):
-            load_llm("NonexistentLLM")
 
+@patch("llm.find_module_with_class")
+def test_load_llm_not_found(mock_find_module):
+    mock_find_module.return_value = None
 
-def test_load_llm_invalid_type():
-    with (
-        patch("llm.find_module_with_class") as mock_find_module,
-        patch("importlib.import_module") as mock_import,
+    with pytest.raises(
+        ValueError,
+        match="Class 'NonexistentLLM' not found in any LLM plugin module",
     ):
-        mock_find_module.return_value = "invalid_llm"
+        load_llm("NonexistentLLM")
 
-        class InvalidLLM:
-            pass
 
-        mock_module = Mock()
-        mock_module.InvalidLLM = InvalidLLM
-        mock_import.return_value = mock_module
+@patch("importlib.import_module")
+@patch("llm.find_module_with_class")
+def test_load_llm_invalid_type(mock_find_module, mock_import):
+    mock_find_module.return_value = "invalid_llm"
 
-        with pytest.raises(
-            ValueError, match="'InvalidLLM' is not a valid LLM subclass"
-        ):
-            load_llm("InvalidLLM")
+    class InvalidLLM:
+        pass
 
+    mock_module = Mock()
+    mock_module.InvalidLLM = InvalidLLM
+    mock_import.return_value = mock_module
 
-def test_find_module_with_class_success():
-    with (
-        patch("os.path.join") as mock_join,
-        patch("os.path.exists") as mock_exists,
-        patch("os.listdir") as mock_listdir,
-        patch("builtins.open", mock_open(read_data="class TestLLM(LLM):\n    pass\n")),
-    ):
-        mock_join.side_effect = lambda *args: "/".join(args)
-        mock_exists.return_value = True
-        mock_listdir.return_value = ["test_llm.py"]
+    with pytest.raises(ValueError, match="'InvalidLLM' is not a valid LLM subclass"):
+        load_llm("InvalidLLM")
 
-        result = find_module_with_class("TestLLM")
-
-        assert result == "test_llm"
 
+@pytest.mark.parametrize(
+    "filename, source, expected",
+    [
+        ("test_llm.py", "class TestLLM(LLM):\n    pass\n", "test_llm"),
+        ("other_file.py", "class OtherClass:\n    pass\n", None),
+    ],
+    ids=["found", "not_found"],
+)
+@patch("os.listdir")
+@patch("os.path.exists")
+def test_find_module_with_class(mock_exists, mock_listdir, filename, source, expected):
+    mock_exists.return_value = True
+    mock_listdir.return_value = [filename]
 
-def test_find_module_with_class_not_found():
-    with (
-        patch("os.path.join") as mock_join,
-        patch("os.path.exists") as mock_exists,
-        patch("os.listdir") as mock_listdir,
-        patch("builtins.open", mock_open(read_data="class OtherClass:\n    pass\n")),
-    ):
-        mock_join.side_effect = lambda *args: "/".join(args)
-        mock_exists.return_value = True
-        mock_listdir.return_value = ["other_file.py"]
-
+    with patch("builtins.open", mock_open(read_data=source)):
         result = find_module_with_class("TestLLM")
 
-        assert result is None
+    assert result == expected
 
 
-def test_find_module_with_class_no_plugins_dir():
-    with patch("os.path.exists") as mock_exists:
-        mock_exists.return_value = False
+@patch("os.path.exists")
+def test_find_module_with_class_no_plugins_dir(mock_exists):
+    mock_exists.return_value = False
 
-        result = find_module_with_class("TestLLM")
+    result = find_module_with_class("TestLLM")
 
-        assert result is None
+    assert result is None
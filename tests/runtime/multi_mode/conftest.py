@@ -0,0 +1,73 @@
+# The hook test classes carry xdist_group marks; run with
+# `pytest -n auto --dist=loadgroup` to keep each class on a single worker.
+
+import json5
+import pytest
+
+
+def _write_mode_config(tmp_path_factory, config_data: dict) -> str:
+    path = tmp_path_factory.mktemp("mode_config") / f"{config_data['name']}.json5"
+    path.write_text(json5.dumps(config_data))
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def env_fallback_config_path(tmp_path_factory):
+    """Mode config file with blank credentials, written once per session."""
+    return _write_mode_config(
+        tmp_path_factory,
+        {
+            "name": "env_test",
+            "default_mode": "default",
+            "robot_ip": "",
+            "api_key": "openmind_free",
+            "URID": "default",
+            "modes": {
+                "default": {
+                    "display_name": "Default",
+                    "description": "Default mode",
+                    "system_prompt_base": "Test prompt",
+                }
+            },
+        },
+    )
+
+
+@pytest.fixture(scope="session")
+def unitree_config_path(tmp_path_factory):
+    """Mode config file with unitree_ethernet set, written once per session."""
+    return _write_mode_config(
+        tmp_path_factory,
+        {
+            "name": "unitree_test",
+            "default_mode": "default",
+            "unitree_ethernet": "eth0",
+            "modes": {
+                "default": {
+                    "display_name": "Default",
+                    "description": "Default mode",
+                    "system_prompt_base": "Test prompt",
+                }
+            },
+        },
+    )
+
+
+@pytest.fixture(scope="session")
+def parallel_hooks_config_path(tmp_path_factory):
+    """Mode config file with parallel_hooks enabled, written once per session."""
+    return _write_mode_config(
+        tmp_path_factory,
+        {
+            "name": "parallel_test",
+            "default_mode": "default",
+            "parallel_hooks": True,
+            "modes": {
+                "default": {
+                    "display_name": "Default",
+                    "description": "Default mode",
+                    "system_prompt_base": "Test prompt",
+                }
+            },
+        },
+    )
@@ -1,5 +1,7 @@
+import copy
+import dataclasses
 import os
-import tempfile
+from contextlib import ExitStack
 from unittest.mock import Mock, patch
 
 import pytest
@@ -55,9 +57,9 @@ def mock_background():
     return mock
 
 
-@pytest.fixture
-def sample_mode_config():
-    """Sample mode configuration for testing."""
+@pytest.fixture(scope="module")
+def sample_mode_config_template():
+    """Sample mode configuration, built once per module; do not mutate."""
     return ModeConfig(
         name="test_mode",
         display_name="Test Mode",
@@ -70,9 +72,9 @@ def sample_mode_config():
     )
 
 
-@pytest.fixture
-def sample_system_config():
-    """Sample system configuration for testing."""
+@pytest.fixture(scope="module")
+def sample_system_config_template():
+    """Sample system configuration, built once per module; do not mutate."""
     return ModeSystemConfig(
         name="test_system",
         default_mode="default",
@@ -89,6 +91,18 @@ def sample_system_config():
 
 
 @pytest.fixture
+def sample_mode_config(sample_mode_config_template):
+    """Per-test copy of the sample mode configuration, safe to mutate."""
+    return copy.copy(sample_mode_config_template)
+
+
+@pytest.fixture
+def sample_system_config(sample_system_config_template):
+    """Per-test copy of the sample system configuration, safe to mutate."""
+    return copy.copy(sample_system_config_template)
+
+
+@pytest.fixture(scope="module")
 def sample_transition_rule():
     """Sample transition rule for testing."""
     return TransitionRule(
@@ -127,6 +141,15 @@ class TestTransitionRule:
         assert rule.timeout_seconds is None
         assert rule.context_conditions == {}
 
+    def test_transition_rule_is_frozen_and_hashable(self, sample_transition_rule):
+        """Test rules cannot be mutated and equal rules hash alike."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sample_transition_rule.priority = 10  # type: ignore[misc]
+
+        assert hash(sample_transition_rule) == hash(
+            dataclasses.replace(sample_transition_rule)
+        )
+
     def test_transition_type_enum(self):
         """Test TransitionType enum values."""
         assert TransitionType.INPUT_TRIGGERED.value == "input_triggered"
@@ -138,9 +161,9 @@ class TestTransitionRule:
 class TestModeConfig:
     """Test cases for ModeConfig class."""
 
-    def test_mode_config_creation(self, sample_mode_config):
+    def test_mode_config_creation(self, sample_mode_config_template):
         """Test basic mode config creation."""
-        config = sample_mode_config
+        config = sample_mode_config_template
         assert config.name == "test_mode"
         assert config.display_name == "Test Mode"
         assert config.description == "A test mode for unit testing"
@@ -196,9 +219,9 @@ class TestModeConfig:
         with pytest.raises(ValueError, match="No LLM configured for mode test_mode"):
             sample_mode_config.to_runtime_config(sample_system_config)
 
-    def test_is_loaded_false(self, sample_mode_config):
+    def test_is_loaded_false(self, sample_mode_config_template):
         """Test is_loaded() returns False when components are not loaded."""
-        assert sample_mode_config.is_loaded() is False
+        assert sample_mode_config_template.is_loaded() is False
 
     def test_is_loaded_true_with_inputs(self, sample_mode_config, mock_sensor):
         """Test is_loaded() returns True when inputs are loaded."""
@@ -229,9 +252,9 @@ class TestModeConfig:
 class TestModeSystemConfig:
     """Test cases for ModeSystemConfig class."""
 
-    def test_system_config_creation(self, sample_system_config):
+    def test_system_config_creation(self, sample_system_config_template):
         """Test basic system config creation."""
-        config = sample_system_config
+        config = sample_system_config_template
         assert config.name == "test_system"
         assert config.default_mode == "default"
         assert config.config_name == "test_config"
@@ -253,6 +276,7 @@ class TestModeSystemConfig:
         assert config.config_name == ""
         assert config.allow_manual_switching is True
         assert config.mode_memory_enabled is True
+        assert config.parallel_hooks is False
         assert config.api_key is None
         assert config.robot_ip is None
         assert config.URID is None
@@ -267,18 +291,30 @@ class TestModeSystemConfig:
 class TestLoadModeComponents:
     """Test cases for _load_mode_components function."""
 
-    @patch("runtime.multi_mode.config.load_input")
-    @patch("runtime.multi_mode.config.load_simulator")
-    @patch("runtime.multi_mode.config.load_action")
-    @patch("runtime.multi_mode.config.load_background")
-    @patch("runtime.multi_mode.config.load_llm")
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _patch_loaders(cls):
+        """Patch the component loaders once for the whole class."""
+        with ExitStack() as stack:
+            cls.loader_mocks = {
+                name: stack.enter_context(patch(f"runtime.multi_mode.config.{name}"))
+                for name in (
+                    "load_input",
+                    "load_simulator",
+                    "load_action",
+                    "load_background",
+                    "load_llm",
+                )
+            }
+            yield
+
+    @pytest.fixture(autouse=True)
+    def _reset_loaders(self):
+        for mock in self.loader_mocks.values():
+            mock.reset_mock(return_value=True, side_effect=True)
+
     def test_load_mode_components_complete(
         self,
-        mock_load_llm,
-        mock_load_background,
-        mock_load_action,
-        mock_load_simulator,
-        mock_load_input,
         sample_mode_config,
         sample_system_config,
         mock_sensor,
@@ -288,11 +324,15 @@ class TestLoadModeComponents:
         mock_llm,
     ):
         """Test loading all component types."""
-        mock_load_input.return_value = lambda config: mock_sensor
-        mock_load_simulator.return_value = lambda config: mock_simulator
-        mock_load_action.return_value = mock_action
-        mock_load_background.return_value = lambda config: mock_background
-        mock_load_llm.return_value = lambda config, available_actions: mock_llm
+        self.loader_mocks["load_input"].return_value = lambda config: mock_sensor
+        self.loader_mocks["load_simulator"].return_value = lambda config: mock_simulator
+        self.loader_mocks["load_action"].return_value = mock_action
+        self.loader_mocks["load_background"].return_value = (
+            lambda config: mock_background
+        )
+        self.loader_mocks["load_llm"].return_value = (
+            lambda config, available_actions: mock_llm
+        )
 
         sample_mode_config._raw_inputs = [{"type": "test_input", "config": {}}]
         sample_mode_config._raw_simulators = [{"type": "test_simulator", "config": {}}]
@@ -314,15 +354,14 @@ class TestLoadModeComponents:
         assert sample_mode_config.backgrounds[0] == mock_background
         assert sample_mode_config.cortex_llm == mock_llm
 
-    @patch("runtime.multi_mode.config.load_llm")
     def test_load_mode_components_with_global_llm(
         self,
-        mock_load_llm,
         sample_mode_config,
         sample_system_config,
         mock_llm,
     ):
         """Test loading components with global LLM configuration."""
+        mock_load_llm = self.loader_mocks["load_llm"]
         mock_load_llm.return_value = lambda config, available_actions: mock_llm
 
         sample_mode_config._raw_llm = None
@@ -360,72 +399,36 @@ class TestLoadModeConfig:
         os.environ,
         {"ROBOT_IP": "env_robot_ip", "OM_API_KEY": "env_api_key", "URID": "env_urid"},
     )
-    def test_load_mode_config_env_fallback(self):
+    def test_load_mode_config_env_fallback(self, env_fallback_config_path):
         """Test that environment variables are used as fallback."""
-        config_data = {
-            "name": "env_test",
-            "default_mode": "default",
-            "robot_ip": "",
-            "api_key": "openmind_free",
-            "URID": "default",
-            "modes": {
-                "default": {
-                    "display_name": "Default",
-                    "description": "Default mode",
-                    "system_prompt_base": "Test prompt",
-                }
-            },
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json5", delete=False) as f:
-            import json5
-
-            json5.dump(config_data, f)
-            temp_file = f.name
-
-        try:
-            with patch("runtime.multi_mode.config.os.path.join") as mock_join:
-                mock_join.return_value = temp_file
-
-                config = load_mode_config("env_test")
-
-                assert config.robot_ip == "env_robot_ip"
-                assert config.api_key == "env_api_key"
-                assert config.URID == "env_urid"
-
-        finally:
-            os.unlink(temp_file)
+        with patch("runtime.multi_mode.config.os.path.join") as mock_join:
+            mock_join.return_value = env_fallback_config_path
+
+            config = load_mode_config("env_test")
+
+            assert config.robot_ip == "env_robot_ip"
+            assert config.api_key == "env_api_key"
+            assert config.URID == "env_urid"
 
     @patch("runtime.multi_mode.config.load_unitree")
-    def test_load_mode_config_with_unitree_ethernet(self, mock_load_unitree):
+    def test_load_mode_config_with_unitree_ethernet(
+        self, mock_load_unitree, unitree_config_path
+    ):
         """Test that unitree_ethernet triggers load_unitree call."""
-        config_data = {
-            "name": "unitree_test",
-            "default_mode": "default",
-            "unitree_ethernet": "eth0",
-            "modes": {
-                "default": {
-                    "display_name": "Default",
-                    "description": "Default mode",
-                    "system_prompt_base": "Test prompt",
-                }
-            },
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json5", delete=False) as f:
-            import json5
-
-            json5.dump(config_data, f)
-            temp_file = f.name
-
-        try:
-            with patch("runtime.multi_mode.config.os.path.join") as mock_join:
-                mock_join.return_value = temp_file
-
-                config = load_mode_config("unitree_test")
-
-                assert config.unitree_ethernet == "eth0"
-                mock_load_unitree.assert_called_once_with("eth0")
-
-        finally:
-            os.unlink(temp_file)
+        with patch("runtime.multi_mode.config.os.path.join") as mock_join:
+            mock_join.return_value = unitree_config_path
+
+            config = load_mode_config("unitree_test")
+
+            assert config.unitree_ethernet == "eth0"
+            mock_load_unitree.assert_called_once_with("eth0")
+
+    def test_load_mode_config_parallel_hooks(self, parallel_hooks_config_path):
+        """Test that parallel_hooks is applied to the system and every mode."""
+        with patch("runtime.multi_mode.config.os.path.join") as mock_join:
+            mock_join.return_value = parallel_hooks_config_path
+
+            config = load_mode_config("parallel_test")
+
+            assert config.parallel_hooks is True
+            assert config.modes["default"].parallel_hooks is True
@@ -1,3 +1,4 @@
+from contextlib import ExitStack
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -5,6 +6,11 @@ import pytest
 from runtime.multi_mode.config import ModeConfig, ModeSystemConfig
 from runtime.multi_mode.cortex import ModeCortexRuntime
 
+# Attribute lists for Mock(spec=...), so the config classes are introspected
+# once per module instead of once per mock.
+_MODE_CONFIG_SPEC = dir(ModeConfig)
+_MODE_SYSTEM_CONFIG_SPEC = dir(ModeSystemConfig)
+
 
 @pytest.fixture
 def sample_mode_config():
@@ -20,7 +26,7 @@ def sample_mode_config():
 @pytest.fixture
 def mock_mode_config():
     """Mock mode config for testing."""
-    mock_config = Mock(spec=ModeConfig)
+    mock_config = Mock(spec=_MODE_CONFIG_SPEC)
     mock_config.name = "test_mode"
     mock_config.display_name = "Test Mode"
     mock_config.description = "A test mode"
@@ -33,7 +39,7 @@ def mock_mode_config():
 @pytest.fixture
 def mock_system_config(mock_mode_config):
     """Mock system configuration for testing."""
-    config = Mock(spec=ModeSystemConfig)
+    config = Mock(spec=_MODE_SYSTEM_CONFIG_SPEC)
     config.name = "test_system"
     config.default_mode = "default"
     config.modes = {
@@ -65,66 +71,75 @@ def mock_orchestrators():
     }
 
 
-@pytest.fixture
-def cortex_runtime(mock_system_config):
-    """ModeCortexRuntime instance for testing."""
-    with (
-        patch("runtime.multi_mode.cortex.ModeManager") as mock_manager_class,
-        patch("runtime.multi_mode.cortex.IOProvider") as mock_io_provider_class,
-        patch(
-            "runtime.multi_mode.cortex.SleepTickerProvider"
-        ) as mock_sleep_provider_class,
-    ):
-        mock_manager = Mock()
-        mock_manager.current_mode_name = "default"
-        mock_manager.add_transition_callback = Mock()
-        mock_manager_class.return_value = mock_manager
-
-        mock_io_provider = Mock()
-        mock_io_provider_class.return_value = mock_io_provider
+def _make_task(done: bool) -> Mock:
+    return Mock(done=Mock(return_value=done), cancel=Mock())
+
+
+@pytest.fixture(scope="class")
+def cortex_deps():
+    """Patch the providers ModeCortexRuntime builds, once per test class."""
+    with ExitStack() as stack:
+        yield {
+            "mode_manager": stack.enter_context(
+                patch("runtime.multi_mode.cortex.ModeManager")
+            ),
+            "io_provider": stack.enter_context(
+                patch("runtime.multi_mode.cortex.IOProvider")
+            ),
+            "sleep_provider": stack.enter_context(
+                patch("runtime.multi_mode.cortex.SleepTickerProvider")
+            ),
+        }
 
-        mock_sleep_provider = Mock()
-        mock_sleep_provider.skip_sleep = False
-        mock_sleep_provider_class.return_value = mock_sleep_provider
 
-        runtime = ModeCortexRuntime(mock_system_config)
-        runtime.mode_manager = mock_manager
-        runtime.io_provider = mock_io_provider
-        runtime.sleep_ticker_provider = mock_sleep_provider
-
-        return runtime, {
-            "mode_manager": mock_manager,
-            "io_provider": mock_io_provider,
-            "sleep_provider": mock_sleep_provider,
-        }
+@pytest.fixture
+def cortex_runtime(cortex_deps, mock_system_config):
+    """ModeCortexRuntime instance for testing."""
+    mock_manager = Mock()
+    mock_manager.current_mode_name = "default"
+    mock_manager.add_transition_callback = Mock()
+    cortex_deps["mode_manager"].return_value = mock_manager
+
+    mock_io_provider = Mock()
+    cortex_deps["io_provider"].return_value = mock_io_provider
+
+    mock_sleep_provider = Mock()
+    mock_sleep_provider.skip_sleep = False
+    cortex_deps["sleep_provider"].return_value = mock_sleep_provider
+
+    runtime = ModeCortexRuntime(mock_system_config)
+    runtime.mode_manager = mock_manager
+    runtime.io_provider = mock_io_provider
+    runtime.sleep_ticker_provider = mock_sleep_provider
+
+    return runtime, {
+        "mode_manager": mock_manager,
+        "io_provider": mock_io_provider,
+        "sleep_provider": mock_sleep_provider,
+    }
 
 
 class TestModeCortexRuntime:
     """Test cases for ModeCortexRuntime class."""
 
-    def test_initialization(self, mock_system_config):
+    def test_initialization(self, cortex_deps, mock_system_config):
         """Test cortex runtime initialization."""
-        with (
-            patch("runtime.multi_mode.cortex.ModeManager") as mock_manager_class,
-            patch("runtime.multi_mode.cortex.IOProvider"),
-            patch("runtime.multi_mode.cortex.SleepTickerProvider"),
-        ):
-            mock_manager = Mock()
-            mock_manager.add_transition_callback = Mock()
-            mock_manager_class.return_value = mock_manager
+        mock_manager = Mock()
+        mock_manager.add_transition_callback = Mock()
+        cortex_deps["mode_manager"].return_value = mock_manager
 
-            runtime = ModeCortexRuntime(mock_system_config)
+        runtime = ModeCortexRuntime(mock_system_config)
 
-            assert runtime.mode_config == mock_system_config
-            assert runtime.current_config is None
-            assert runtime.fuser is None
-            assert runtime.action_orchestrator is None
-            assert runtime.simulator_orchestrator is None
-            assert runtime.background_orchestrator is None
-            assert runtime.input_orchestrator is None
-            assert runtime._mode_initialized is False
+        assert runtime.mode_config == mock_system_config
+        assert runtime.current_config is None
+        assert runtime.fuser is None
+        assert runtime.action_orchestrator is None
+        assert runtime.simulator_orchestrator is None
+        assert runtime.background_orchestrator is None
+        assert runtime.input_orchestrator is None
+        assert runtime._mode_initialized is False
 
-            mock_manager.add_transition_callback.assert_called_once()
+        mock_manager.add_transition_callback.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_initialize_mode(self, cortex_runtime, mock_mode_config):
@@ -223,64 +238,6 @@ class TestModeCortexRuntime:
             with pytest.raises(Exception, match="Test error"):
                 await runtime._on_mode_transition("from_mode", "to_mode")
 
-    @pytest.mark.asyncio
-    async def test_stop_current_orchestrators(self, cortex_runtime):
-        """Test stopping current orchestrators."""
-        runtime, mocks = cortex_runtime
-
-        mock_input_task = Mock()
-        mock_input_task.done.return_value = False
-        mock_input_task.cancel = Mock()
-
-        mock_simulator_task = Mock()
-        mock_simulator_task.done.return_value = False
-        mock_simulator_task.cancel = Mock()
-
-        mock_action_task = Mock()
-        mock_action_task.done.return_value = False
-        mock_action_task.cancel = Mock()
-
-        mock_background_task = Mock()
-        mock_background_task.done.return_value = False
-        mock_background_task.cancel = Mock()
-
-        runtime.input_listener_task = mock_input_task
-        runtime.simulator_task = mock_simulator_task
-        runtime.action_task = mock_action_task
-        runtime.background_task = mock_background_task
-
-        with patch("asyncio.gather", new_callable=AsyncMock) as mock_gather:
-            await runtime._stop_current_orchestrators()
-
-            mock_input_task.cancel.assert_called_once()
-            mock_simulator_task.cancel.assert_called_once()
-            mock_action_task.cancel.assert_called_once()
-            mock_background_task.cancel.assert_called_once()
-
-            mock_gather.assert_called_once()
-
-            assert runtime.input_listener_task is None
-            assert runtime.simulator_task is None
-            assert runtime.action_task is None
-            assert runtime.background_task is None
-
-    @pytest.mark.asyncio
-    async def test_stop_current_orchestrators_done_tasks(self, cortex_runtime):
-        """Test stopping orchestrators with already done tasks."""
-        runtime, mocks = cortex_runtime
-
-        mock_task = Mock()
-        mock_task.done.return_value = True
-        mock_task.cancel = Mock()
-
-        runtime.input_listener_task = mock_task
-
-        with patch("asyncio.gather", new_callable=AsyncMock) as mock_gather:
-            await runtime._stop_current_orchestrators()
-
-            mock_task.cancel.assert_not_called()
-            mock_gather.assert_not_called()
-
     @pytest.mark.asyncio
     async def test_start_orchestrators_no_config(self, cortex_runtime):
         """Test starting orchestrators without current config raises error."""
@@ -290,25 +247,41 @@ class TestModeCortexRuntime:
         with pytest.raises(RuntimeError, match="No current config available"):
             await runtime._start_orchestrators()
 
+    @pytest.mark.parametrize(
+        "method, task_states",
+        [
+            (
+                "_stop_current_orchestrators",
+                {
+                    "input_listener_task": False,
+                    "simulator_task": False,
+                    "action_task": False,
+                    "background_task": False,
+                },
+            ),
+            ("_stop_current_orchestrators", {"input_listener_task": True}),
+            ("_cleanup_tasks", {"input_listener_task": False, "simulator_task": False}),
+        ],
+        ids=["stop_running_tasks", "stop_done_tasks", "cleanup_running_tasks"],
+    )
     @pytest.mark.asyncio
-    async def test_cleanup_tasks(self, cortex_runtime):
-        """Test cleanup of all tasks."""
+    async def test_cancel_tasks(self, cortex_runtime, method, task_states):
+        """Test that only running tasks are cancelled and awaited."""
         runtime, mocks = cortex_runtime
 
-        mock_task1 = Mock()
-        mock_task1.done.return_value = False
-        mock_task1.cancel = Mock()
-
-        mock_task2 = Mock()
-        mock_task2.done.return_value = False
-        mock_task2.cancel = Mock()
-
-        runtime.input_listener_task = mock_task1
-        runtime.simulator_task = mock_task2
+        tasks = {name: _make_task(done) for name, done in task_states.items()}
+        for name, task in tasks.items():
+            setattr(runtime, name, task)
 
         with patch("asyncio.gather", new_callable=AsyncMock) as mock_gather:
-            await runtime._cleanup_tasks()
+            await getattr(runtime, method)()
+
+        for name, task in tasks.items():
+            assert task.cancel.called is not task_states[name]
+        assert mock_gather.called is not all(task_states.values())
 
-            mock_task1.cancel.assert_called_once()
-            mock_task2.cancel.assert_called_once()
-            mock_gather.assert_called_once()
+        if method == "_stop_current_orchestrators":
+            assert runtime.input_listener_task is None
+            assert runtime.simulator_task is None
+            assert runtime.action_task is None
+            assert runtime.background_task is None
@@ -1,5 +1,9 @@
 import asyncio
-from unittest.mock import AsyncMock, Mock, mock_open, patch
+import dataclasses
+import io
+from types import MappingProxyType
+from typing import Any, Callable, Optional
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -11,13 +15,129 @@ from runtime.multi_mode.hook import (
     LifecycleHookHandler,
     LifecycleHookType,
     MessageHookHandler,
+    _create_stateless_hook_handler,
+    _function_cache,
     create_hook_handler,
     execute_lifecycle_hooks,
     parse_lifecycle_hooks,
 )
 
+# Hook module sources read by FunctionHookHandler._find_function_in_module
+_FILE_SYNC = "def test_func():\n    pass"
+_FILE_ASYNC = "async def test_func():\n    pass"
+_FILE_OTHER = "def other_function():\n    pass"
+
+
+def _fake_open(content: str):
+    """Stand-in for builtins.open that serves content from an in-memory file."""
+    return lambda *args, **kwargs: io.StringIO(content)
+
+
+def _message_hook(message: str = "test", **kwargs) -> LifecycleHook:
+    """Build an ON_ENTRY message hook; kwargs override the remaining fields."""
+    return LifecycleHook(
+        hook_type=LifecycleHookType.ON_ENTRY,
+        handler_type="message",
+        handler_config={"message": message},
+        **kwargs,
+    )
+
+
+def _run_without_loop(coro):
+    """Drive a coroutine that must finish without suspending; return its result."""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise AssertionError("coroutine suspended instead of returning immediately")
+
+
+class _FakeProcess:
+    """Minimal stand-in for the process returned by create_subprocess_shell."""
+
+    def __init__(self, stdout: bytes, stderr: bytes, returncode: int):
+        self._stdout = stdout
+        self._stderr = stderr
+        self.returncode = returncode
+
+    async def communicate(self):
+        return self._stdout, self._stderr
+
+
+class _StubHandler:
+    """Lifecycle hook handler stub recording a copy of each execute() context."""
+
+    def __init__(
+        self,
+        result: bool = True,
+        raise_exc: Optional[Exception] = None,
+        delay: Optional[float] = None,
+        wait_for: Optional[asyncio.Event] = None,
+        on_call: Optional[Callable[[], Any]] = None,
+    ):
+        self.calls = []
+        self.result = result
+        self.raise_exc = raise_exc
+        self.delay = delay
+        self.wait_for = wait_for
+        self.on_call = on_call
+
+    async def execute(self, context):
+        self.calls.append(dict(context))
+        if self.on_call:
+            self.on_call()
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.wait_for:
+            await asyncio.wait_for(self.wait_for.wait(), timeout=1)
+        if self.raise_exc:
+            raise self.raise_exc
+        return self.result
+
+
+def _handler_by_message(handlers):
+    """create_hook_handler stand-in picking a handler by the hook's message."""
+    return lambda hook: handlers[hook.handler_config["message"]]
+
+
+class _StubConnector:
+    """Action connector stub recording each connect() input."""
+
+    def __init__(self, raise_exc: Optional[Exception] = None):
+        self.calls = []
+        self.raise_exc = raise_exc
+
+    async def connect(self, input_protocol):
+        self.calls.append(input_protocol)
+        if self.raise_exc:
+            raise self.raise_exc
+
+
+@pytest.fixture(autouse=True)
+def clear_hook_handler_cache():
+    _create_stateless_hook_handler.cache_clear()
+    yield
+    _create_stateless_hook_handler.cache_clear()
+
 
 @pytest.fixture
+def mock_logging(monkeypatch):
+    """Replace the hook module's logger for assertions on logged messages."""
+    mock = Mock()
+    monkeypatch.setattr("runtime.multi_mode.hook.logging", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_create_handler(monkeypatch):
+    """Replace create_hook_handler; tests set its return_value or side_effect."""
+    mock = Mock()
+    monkeypatch.setattr("runtime.multi_mode.hook.create_hook_handler", mock)
+    return mock
+
+
+@pytest.fixture(scope="module")
 def sample_message_hook():
     """Sample message hook configuration."""
     return LifecycleHook(
@@ -33,7 +153,7 @@ def sample_message_hook():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_command_hook():
     """Sample command hook configuration."""
     return LifecycleHook(
@@ -47,7 +167,7 @@ def sample_command_hook():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_function_hook():
     """Sample function hook configuration."""
     return LifecycleHook(
@@ -64,7 +184,7 @@ def sample_function_hook():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_action_hook():
     """Sample action hook configuration."""
     return LifecycleHook(
@@ -81,14 +201,16 @@ def sample_action_hook():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_context():
-    """Sample context for hook execution."""
-    return {
-        "mode_name": "test_mode",
-        "user_id": "user123",
-        "timestamp": "2025-01-01T00:00:00Z",
-    }
+    """Sample context for hook execution, read-only as it is shared."""
+    return MappingProxyType(
+        {
+            "mode_name": "test_mode",
+            "user_id": "user123",
+            "timestamp": "2025-01-01T00:00:00Z",
+        }
+    )
 
 
 def test_hook_type_values():
@@ -126,6 +248,14 @@ def test_hook_with_custom_values(sample_command_hook):
     assert sample_command_hook.priority == 2
 
 
+def test_hook_is_frozen_and_hashable(sample_command_hook):
+    """Test shared hooks cannot be mutated and equal hooks hash alike."""
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        sample_command_hook.priority = 10  # type: ignore[misc]
+
+    assert hash(_message_hook("test")) == hash(_message_hook("test"))
+
+
 def test_base_handler_creation():
     """Test base handler creation."""
     config = {"test": "value"}
@@ -133,7 +263,6 @@ def test_base_handler_creation():
     assert handler.config == config
 
 
-@pytest.mark.asyncio
 async def test_base_handler_execute_not_implemented():
     """Test that base handler execute method raises NotImplementedError."""
     handler = LifecycleHookHandler({})
@@ -148,85 +277,117 @@ def test_message_handler_creation():
     assert handler.config == config
 
 
-@pytest.mark.asyncio
-async def test_message_handler_basic_execution(sample_context):
+async def test_message_handler_basic_execution(sample_context, mock_logging):
     """Test basic message handler execution."""
     config = {"message": "Mode: {mode_name}"}
     handler = MessageHookHandler(config)
 
-    with patch("runtime.multi_mode.hook.logging") as mock_logging:
-        result = await handler.execute(sample_context)
-        assert result is True
-        mock_logging.info.assert_called_once_with(
-            "Lifecycle hook message: Mode: test_mode"
-        )
+    result = await handler.execute(sample_context)
+    assert result is True
+    mock_logging.info.assert_called_once_with("Lifecycle hook message: Mode: test_mode")
 
 
-@pytest.mark.asyncio
-async def test_message_handler_with_announcement(sample_context):
+async def test_message_handler_with_announcement(sample_context, mock_logging):
     """Test message handler with TTS announcement."""
     config = {"message": "Mode: {mode_name}"}
     handler = MessageHookHandler(config)
 
-    mock_tts = Mock()
-    mock_tts.add_pending_message = Mock()
+    # ElevenLabsTTSProvider is a @singleton getter, not a class, so spell out
+    # the one method the handler uses.
+    mock_tts = Mock(spec_set=["add_pending_message"])
 
-    with patch("runtime.multi_mode.hook.logging") as mock_logging:
-        with patch(
-            "runtime.multi_mode.hook.ElevenLabsTTSProvider", return_value=mock_tts
-        ):
-            result = await handler.execute(sample_context)
-            assert result is True
-            mock_logging.info.assert_called_once()
-            mock_tts.add_pending_message.assert_called_once_with("Mode: test_mode")
+    with patch("runtime.multi_mode.hook.ElevenLabsTTSProvider", return_value=mock_tts):
+        result = await handler.execute(sample_context)
+        assert result is True
+        mock_logging.info.assert_called_once()
+        mock_tts.add_pending_message.assert_called_once_with("Mode: test_mode")
 
 
-@pytest.mark.asyncio
-async def test_message_handler_tts_import_error(sample_context):
+async def test_message_handler_tts_import_error(sample_context, mock_logging):
     """Test message handler when TTS provider is not available."""
     config = {"message": "Mode: {mode_name}"}
     handler = MessageHookHandler(config)
 
-    with patch("runtime.multi_mode.hook.logging") as mock_logging:
-        with patch(
-            "runtime.multi_mode.hook.ElevenLabsTTSProvider", side_effect=ImportError
-        ):
-            result = await handler.execute(sample_context)
-            assert result is False
-            mock_logging.error.assert_called_once_with("Error adding TTS message: ")
+    with patch(
+        "runtime.multi_mode.hook.ElevenLabsTTSProvider", side_effect=ImportError
+    ):
+        result = await handler.execute(sample_context)
+        assert result is False
+        mock_logging.error.assert_called_once_with("Error adding TTS message: ")
 
 
-@pytest.mark.asyncio
-async def test_message_handler_format_error():
+async def test_message_handler_format_error(mock_logging):
     """Test message handler with format error."""
     config = {"message": "Invalid format: {nonexistent_key}"}
     handler = MessageHookHandler(config)
     context = {"mode_name": "test"}
 
-    with patch("runtime.multi_mode.hook.logging") as mock_logging:
-        result = await handler.execute(context)
-        assert result is False
-        mock_logging.error.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_message_handler_no_message():
-    """Test message handler with no message configured."""
-    config = {}
-    handler = MessageHookHandler(config)
+    result = await handler.execute(context)
+    assert result is False
+    mock_logging.error.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "handler_cls, config, expected, level, message",
+    [
+        (MessageHookHandler, {}, True, None, None),
+        (MessageHookHandler, {"message": ""}, True, None, None),
+        (
+            CommandHookHandler,
+            {},
+            False,
+            "warning",
+            "No command specified for command hook",
+        ),
+        (
+            CommandHookHandler,
+            {"command": ""},
+            False,
+            "warning",
+            "No command specified for command hook",
+        ),
+        (
+            FunctionHookHandler,
+            {"module_name": "test_module"},
+            False,
+            "error",
+            "No function specified for function hook",
+        ),
+        (
+            FunctionHookHandler,
+            {"function": "test_func"},
+            False,
+            "error",
+            "No module_name specified for function hook",
+        ),
+        (
+            ActionHookHandler,
+            {"action_config": {}},
+            False,
+            "error",
+            "No action_type specified for action hook",
+        ),
+    ],
+    ids=[
+        "message_missing",
+        "message_empty",
+        "command_missing",
+        "command_empty",
+        "function_missing",
+        "module_missing",
+        "action_type_missing",
+    ],
+)
+async def test_handler_degenerate_config(
+    handler_cls, config, expected, level, message, mock_logging
+):
+    """Test handlers with missing or empty required configuration."""
+    handler = handler_cls(config)
 
     result = await handler.execute({})
-    assert result is True
-
-
-@pytest.mark.asyncio
-async def test_message_handler_empty_message():
-    """Test message handler with empty message."""
-    config = {"message": ""}
-    handler = MessageHookHandler(config)
-
-    result = await handler.execute({})
-    assert result is True
+    assert result is expected
+    if level is not None:
+        getattr(mock_logging, level).assert_called_once_with(message)
 
 
 def test_command_handler_creation():
@@ -236,78 +397,41 @@ def test_command_handler_creation():
     assert handler.config == config
 
 
-@pytest.mark.asyncio
-async def test_command_handler_successful_execution(sample_context):
+async def test_command_handler_successful_execution(sample_context, mock_logging):
     """Test successful command execution."""
     config = {"command": "echo 'Mode: {mode_name}'"}
     handler = CommandHookHandler(config)
 
-    # Mock successful process
-    mock_process = AsyncMock()
-    mock_process.communicate.return_value = (b"Mode: test_mode\n", b"")
-    mock_process.returncode = 0
+    mock_process = _FakeProcess(b"Mode: test_mode\n", b"", 0)
 
     with patch(
         "runtime.multi_mode.hook.asyncio.create_subprocess_shell",
         return_value=mock_process,
     ):
-        with patch("runtime.multi_mode.hook.logging") as mock_logging:
-            result = await handler.execute(sample_context)
-            assert result is True
-            mock_logging.info.assert_called_once_with(
-                "Hook command output: Mode: test_mode"
-            )
+        result = await handler.execute(sample_context)
+        assert result is True
+        mock_logging.info.assert_called_once_with(
+            "Hook command output: Mode: test_mode"
+        )
 
 
-@pytest.mark.asyncio
-async def test_command_handler_failed_execution(sample_context):
+async def test_command_handler_failed_execution(sample_context, mock_logging):
     """Test failed command execution."""
     config = {"command": "false"}  # Command that always fails
     handler = CommandHookHandler(config)
 
-    # Mock failed process
-    mock_process = AsyncMock()
-    mock_process.communicate.return_value = (b"", b"Command failed")
-    mock_process.returncode = 1
+    mock_process = _FakeProcess(b"", b"Command failed", 1)
 
     with patch(
         "runtime.multi_mode.hook.asyncio.create_subprocess_shell",
         return_value=mock_process,
     ):
-        with patch("runtime.multi_mode.hook.logging") as mock_logging:
-            result = await handler.execute(sample_context)
-            assert result is False
-            mock_logging.error.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_command_handler_no_command():
-    """Test command handler with no command specified."""
-    config = {}
-    handler = CommandHookHandler(config)
-
-    with patch("runtime.multi_mode.hook.logging") as mock_logging:
-        result = await handler.execute({})
-        assert result is False
-        mock_logging.warning.assert_called_once_with(
-            "No command specified for command hook"
-        )
-
-
-@pytest.mark.asyncio
-async def test_command_handler_empty_command():
-    """Test command handler with empty command."""
-    config = {"command": ""}
-    handler = CommandHookHandler(config)
-
-    with patch("runtime.multi_mode.hook.logging") as mock_logging:
-        result = await handler.execute({})
+        result = await handler.execute(sample_context)
         assert result is False
-        mock_logging.warning.assert_called_once()
+        mock_logging.error.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_command_handler_execution_exception(sample_context):
+async def test_command_handler_execution_exception(sample_context, mock_logging):
     """Test command handler with execution exception."""
     config = {"command": "echo test"}
     handler = CommandHookHandler(config)
@@ -316,21 +440,17 @@ async def test_command_handler_execution_exception(sample_context):
         "runtime.multi_mode.hook.asyncio.create_subprocess_shell",
         side_effect=OSError("Permission denied"),
     ):
-        with patch("runtime.multi_mode.hook.logging") as mock_logging:
-            result = await handler.execute(sample_context)
-            assert result is False
-            mock_logging.error.assert_called_once()
+        result = await handler.execute(sample_context)
+        assert result is False
+        mock_logging.error.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_command_handler_successful_no_output(sample_context):
     """Test successful command with no output."""
     config = {"command": "true"}  # Command that succeeds with no output
     handler = CommandHookHandler(config)
 
-    mock_process = AsyncMock()
-    mock_process.communicate.return_value = (b"", b"")
-    mock_process.returncode = 0
+    mock_process = _FakeProcess(b"", b"", 0)
 
     with patch(
         "runtime.multi_mode.hook.asyncio.create_subprocess_shell",
@@ -340,41 +460,23 @@ async def test_command_handler_successful_no_output(sample_context):
         assert result is True
 
 
-def test_function_handler_creation():
-    """Test function handler creation."""
-    config = {"function": "test_func", "module_name": "test_module"}
-    handler = FunctionHookHandler(config)
-    assert handler.config == config
-
+class TestFunctionHookHandler:
+    """Test cases for FunctionHookHandler."""
 
-@pytest.mark.asyncio
-async def test_function_handler_no_function():
-    """Test function handler with no function specified."""
-    config = {"module_name": "test_module"}
-    handler = FunctionHookHandler(config)
+    pytestmark = pytest.mark.xdist_group("hook_function_handler")
 
-    with patch("runtime.multi_mode.hook.logging") as mock_logging:
-        result = await handler.execute({})
-        assert result is False
-        mock_logging.error.assert_called_once_with(
-            "No function specified for function hook"
-        )
+    @pytest.fixture(autouse=True)
+    def clear_find_function_cache(self):
+        _function_cache.clear()
+        yield
+        _function_cache.clear()
 
+    def test_function_handler_creation(self):
+        """Test function handler creation."""
+        config = {"function": "test_func", "module_name": "test_module"}
+        handler = FunctionHookHandler(config)
+        assert handler.config == config
 
-@pytest.mark.asyncio
-async def test_function_handler_no_module():
-    """Test function handler with no module specified."""
-    config = {"function": "test_func"}
-    handler = FunctionHookHandler(config)
-
-    with patch("runtime.multi_mode.hook.logging") as mock_logging:
-        result = await handler.execute({})
-        assert result is False
-        mock_logging.error.assert_called_once_with(
-            "No module_name specified for function hook"
-        )
-
-    @pytest.mark.asyncio
     async def test_function_handler_successful_sync_execution(self, sample_context):
         """Test successful synchronous function execution."""
         config = {"function": "test_func", "module_name": "test_module"}
@@ -383,13 +485,13 @@ async def test_function_handler_no_module():
         def mock_function(context):
             return True
 
-        with patch.object(
-            handler, "_find_function_in_module", return_value=mock_function
-        ):
-            result = await handler.execute(sample_context)
-            assert result is True
+        handler._find_function_in_module = (
+            lambda module_name, function_name: mock_function
+        )
+
+        result = await handler.execute(sample_context)
+        assert result is True
 
-    @pytest.mark.asyncio
     async def test_function_handler_successful_async_execution(self, sample_context):
         """Test successful asynchronous function execution."""
         config = {"function": "test_func", "module_name": "test_module"}
@@ -398,13 +500,13 @@ async def test_function_handler_no_module():
         async def mock_async_function(context):
             return True
 
-        with patch.object(
-            handler, "_find_function_in_module", return_value=mock_async_function
-        ):
-            result = await handler.execute(sample_context)
-            assert result is True
+        handler._find_function_in_module = (
+            lambda module_name, function_name: mock_async_function
+        )
+
+        result = await handler.execute(sample_context)
+        assert result is True
 
-    @pytest.mark.asyncio
     async def test_function_handler_function_returns_false(self, sample_context):
         """Test function that returns False."""
         config = {"function": "test_func", "module_name": "test_module"}
@@ -413,13 +515,13 @@ async def test_function_handler_no_module():
         def mock_function(context):
             return False
 
-        with patch.object(
-            handler, "_find_function_in_module", return_value=mock_function
-        ):
-            result = await handler.execute(sample_context)
-            assert result is False
+        handler._find_function_in_module = (
+            lambda module_name, function_name: mock_function
+        )
+
+        result = await handler.execute(sample_context)
+        assert result is False
 
-    @pytest.mark.asyncio
     async def test_function_handler_function_returns_none(self, sample_context):
         """Test function that returns None (should be treated as success)."""
         config = {"function": "test_func", "module_name": "test_module"}
@@ -428,24 +530,26 @@ async def test_function_handler_no_module():
         def mock_function(context):
             return None
 
-        with patch.object(
-            handler, "_find_function_in_module", return_value=mock_function
-        ):
-            result = await handler.execute(sample_context)
-            assert result is True
+        handler._find_function_in_module = (
+            lambda module_name, function_name: mock_function
+        )
+
+        result = await handler.execute(sample_context)
+        assert result is True
 
-    @pytest.mark.asyncio
     async def test_function_handler_function_not_found(self, sample_context):
         """Test function handler when function is not found."""
         config = {"function": "test_func", "module_name": "test_module"}
         handler = FunctionHookHandler(config)
 
-        with patch.object(handler, "_find_function_in_module", return_value=None):
-            result = await handler.execute(sample_context)
-            assert result is False
+        handler._find_function_in_module = lambda module_name, function_name: None
+
+        result = await handler.execute(sample_context)
+        assert result is False
 
-    @pytest.mark.asyncio
-    async def test_function_handler_execution_exception(self, sample_context):
+    async def test_function_handler_execution_exception(
+        self, sample_context, mock_logging
+    ):
         """Test function handler with execution exception."""
         config = {"function": "test_func", "module_name": "test_module"}
         handler = FunctionHookHandler(config)
@@ -453,120 +557,141 @@ async def test_function_handler_no_module():
         def mock_function(context):
             raise ValueError("Test error")
 
-        with patch.object(
-            handler, "_find_function_in_module", return_value=mock_function
-        ):
-            with patch("runtime.multi_mode.hook.logging") as mock_logging:
-                result = await handler.execute(sample_context)
-                assert result is False
-                mock_logging.error.assert_called_once()
+        handler._find_function_in_module = (
+            lambda module_name, function_name: mock_function
+        )
 
-    def test_find_function_in_module_hooks_dir_not_found(self):
+        result = await handler.execute(sample_context)
+        assert result is False
+        mock_logging.error.assert_called_once()
+
+    def test_find_function_in_module_hooks_dir_not_found(self, mock_logging):
         """Test function search when hooks directory doesn't exist."""
         handler = FunctionHookHandler({})
 
         with patch("runtime.multi_mode.hook.os.path.exists", return_value=False):
-            with patch("runtime.multi_mode.hook.logging") as mock_logging:
-                result = handler._find_function_in_module("test_module", "test_func")
-                assert result is None
-                mock_logging.error.assert_called_once()
+            result = handler._find_function_in_module("test_module", "test_func")
+            assert result is None
+            mock_logging.error.assert_called_once()
 
-    def test_find_function_in_module_file_not_found(self):
+    def test_find_function_in_module_file_not_found(self, mock_logging):
         """Test function search when module file doesn't exist."""
         handler = FunctionHookHandler({})
 
         with patch("runtime.multi_mode.hook.os.path.exists", side_effect=[True, False]):
-            with patch("runtime.multi_mode.hook.logging") as mock_logging:
-                result = handler._find_function_in_module("test_module", "test_func")
-                assert result is None
-                mock_logging.error.assert_called_once()
+            result = handler._find_function_in_module("test_module", "test_func")
+            assert result is None
+            mock_logging.error.assert_called_once()
 
-    def test_find_function_in_module_function_not_in_file(self):
+    @patch("builtins.open", _fake_open(_FILE_OTHER))
+    @patch("runtime.multi_mode.hook.os.path.exists", return_value=True)
+    def test_find_function_in_module_function_not_in_file(
+        self, mock_exists, mock_logging
+    ):
         """Test function search when function is not found in file."""
         handler = FunctionHookHandler({})
 
-        file_content = "def other_function():\n    pass"
+        result = handler._find_function_in_module("test_module", "test_func")
+        assert result is None
+        mock_logging.error.assert_called_once()
 
-        with patch("runtime.multi_mode.hook.os.path.exists", return_value=True):
-            with patch("builtins.open", mock_open(read_data=file_content)):
-                with patch("runtime.multi_mode.hook.logging") as mock_logging:
-                    result = handler._find_function_in_module(
-                        "test_module", "test_func"
-                    )
-                    assert result is None
-                    mock_logging.error.assert_called_once()
-
-    def test_find_function_in_module_import_error(self):
+    @patch(
+        "runtime.multi_mode.hook.importlib.import_module",
+        side_effect=ImportError("Module not found"),
+    )
+    @patch("builtins.open", _fake_open(_FILE_SYNC))
+    @patch("runtime.multi_mode.hook.os.path.exists", return_value=True)
+    def test_find_function_in_module_import_error(
+        self, mock_exists, mock_import, mock_logging
+    ):
         """Test function search with import error."""
         handler = FunctionHookHandler({})
 
-        file_content = "def test_func():\n    pass"
+        result = handler._find_function_in_module("test_module", "test_func")
+        assert result is None
+        mock_logging.error.assert_called_once()
 
-        with patch("runtime.multi_mode.hook.os.path.exists", return_value=True):
-            with patch("builtins.open", mock_open(read_data=file_content)):
-                with patch(
-                    "runtime.multi_mode.hook.importlib.import_module",
-                    side_effect=ImportError("Module not found"),
-                ):
-                    with patch("runtime.multi_mode.hook.logging") as mock_logging:
-                        result = handler._find_function_in_module(
-                            "test_module", "test_func"
-                        )
-                        assert result is None
-                        mock_logging.error.assert_called_once()
-
-    def test_find_function_in_module_successful(self):
+    @patch("runtime.multi_mode.hook.hasattr", return_value=True)
+    @patch("runtime.multi_mode.hook.importlib.import_module")
+    @patch("builtins.open", _fake_open(_FILE_SYNC))
+    @patch("runtime.multi_mode.hook.os.path.exists", return_value=True)
+    def test_find_function_in_module_successful(
+        self, mock_exists, mock_import, mock_hasattr
+    ):
         """Test successful function search and import."""
         handler = FunctionHookHandler({})
 
-        file_content = "def test_func():\n    pass"
-
         def mock_function():
             pass
 
-        mock_module = Mock()
-        mock_module.test_func = mock_function
+        mock_import.return_value.test_func = mock_function
 
-        with patch("runtime.multi_mode.hook.os.path.exists", return_value=True):
-            with patch("builtins.open", mock_open(read_data=file_content)):
-                with patch(
-                    "runtime.multi_mode.hook.importlib.import_module",
-                    return_value=mock_module,
-                ):
-                    with patch("runtime.multi_mode.hook.hasattr", return_value=True):
-                        result = handler._find_function_in_module(
-                            "test_module", "test_func"
-                        )
-                        assert result == mock_function
-
-    def test_find_function_in_module_async_function(self):
+        result = handler._find_function_in_module("test_module", "test_func")
+        assert result == mock_function
+
+    @patch("runtime.multi_mode.hook.hasattr", return_value=True)
+    @patch("runtime.multi_mode.hook.importlib.import_module")
+    @patch("builtins.open", _fake_open(_FILE_ASYNC))
+    @patch("runtime.multi_mode.hook.os.path.exists", return_value=True)
+    def test_find_function_in_module_async_function(
+        self, mock_exists, mock_import, mock_hasattr
+    ):
         """Test finding async function."""
         handler = FunctionHookHandler({})
 
-        file_content = "async def test_func():\n    pass"
-
         async def mock_async_function():
             pass
 
-        mock_module = Mock()
-        mock_module.test_func = mock_async_function
+        mock_import.return_value.test_func = mock_async_function
+
+        result = handler._find_function_in_module("test_module", "test_func")
+        assert result == mock_async_function
+
+    @patch("runtime.multi_mode.hook.importlib.import_module")
+    @patch("builtins.open", _fake_open(_FILE_SYNC))
+    @patch("runtime.multi_mode.hook.os.path.exists", return_value=True)
+    def test_find_function_in_module_cached(self, mock_exists, mock_import):
+        """Test repeated lookups reuse the resolved function."""
+        handler = FunctionHookHandler({})
+
+        def mock_function():
+            pass
+
+        mock_import.return_value.test_func = mock_function
+
+        first = handler._find_function_in_module("test_module", "test_func")
+        second = FunctionHookHandler({})._find_function_in_module(
+            "test_module", "test_func"
+        )
+
+        assert first is second is mock_function
+        assert mock_import.call_count == 1
+
+    @patch("runtime.multi_mode.hook.importlib.import_module")
+    @patch("builtins.open", _fake_open(_FILE_SYNC))
+    def test_find_function_in_module_retries_after_miss(self, mock_import):
+        """Test a failed lookup is not cached and is retried on the next call."""
+        handler = FunctionHookHandler({})
+
+        def mock_function():
+            pass
+
+        mock_import.return_value.test_func = mock_function
+
+        with patch("runtime.multi_mode.hook.os.path.exists", return_value=False):
+            assert handler._find_function_in_module("test_module", "test_func") is None
 
         with patch("runtime.multi_mode.hook.os.path.exists", return_value=True):
-            with patch("builtins.open", mock_open(read_data=file_content)):
-                with patch(
-                    "runtime.multi_mode.hook.importlib.import_module",
-                    return_value=mock_module,
-                ):
-                    with patch("runtime.multi_mode.hook.hasattr", return_value=True):
-                        result = handler._find_function_in_module(
-                            "test_module", "test_func"
-                        )
-                        assert result == mock_async_function
+            result = handler._find_function_in_module("test_module", "test_func")
+
+        assert result is mock_function
 
 
 class TestActionHookHandler:
     """Test cases for ActionHookHandler."""
 
+    pytestmark = pytest.mark.xdist_group("hook_action_handler")
+
     def test_action_handler_creation(self):
         """Test action handler creation."""
         config = {"action_type": "test_action", "action_config": {}}
@@ -574,77 +699,52 @@ class TestActionHookHandler:
         assert handler.config == config
         assert handler.action is None
 
-    @pytest.mark.asyncio
-    async def test_action_handler_no_action_type(self):
-        """Test action handler with no action type specified."""
-        config = {"action_config": {}}
-        handler = ActionHookHandler(config)
-
-        with patch("runtime.multi_mode.hook.logging") as mock_logging:
-            result = await handler.execute({})
-            assert result is False
-            mock_logging.error.assert_called_once_with(
-                "No action_type specified for action hook"
-            )
-
-    @pytest.mark.asyncio
-    async def test_action_handler_action_load_error(self, sample_context):
+    async def test_action_handler_action_load_error(self, sample_context, mock_logging):
         """Test action handler with action loading error."""
         config = {"action_type": "nonexistent_action", "action_config": {}}
         handler = ActionHookHandler(config)
 
         with patch("actions.load_action", side_effect=ImportError("Action not found")):
-            with patch("runtime.multi_mode.hook.logging") as mock_logging:
-                result = await handler.execute(sample_context)
-                assert result is False
-                mock_logging.error.assert_called_once()
+            result = await handler.execute(sample_context)
+            assert result is False
+            mock_logging.error.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_action_handler_successful_execution(self, sample_context):
         """Test successful action execution."""
         config = {"action_type": "test_action", "action_config": {"param": "value"}}
         handler = ActionHookHandler(config)
 
-        # Mock action and connector
-        mock_connector = AsyncMock()
-        mock_connector.connect = AsyncMock(return_value=None)
+        connector = _StubConnector()
         mock_action = Mock()
-        mock_action.connector = mock_connector
+        mock_action.connector = connector
 
         with patch("actions.load_action", return_value=mock_action):
             result = await handler.execute(sample_context)
             assert result is True
-            mock_connector.connect.assert_called_once_with(
-                sample_context.get("input_data")
-            )
+            assert connector.calls == [sample_context.get("input_data")]
 
-    @pytest.mark.asyncio
-    async def test_action_handler_execution_error(self, sample_context):
+    async def test_action_handler_execution_error(self, sample_context, mock_logging):
         """Test action handler with execution error."""
         config = {"action_type": "test_action", "action_config": {}}
         handler = ActionHookHandler(config)
 
-        mock_connector = AsyncMock()
-        mock_connector.connect = AsyncMock(side_effect=Exception("Connection failed"))
+        connector = _StubConnector(raise_exc=Exception("Connection failed"))
         mock_action = Mock()
-        mock_action.connector = mock_connector
+        mock_action.connector = connector
 
         with patch("actions.load_action", return_value=mock_action):
-            with patch("runtime.multi_mode.hook.logging") as mock_logging:
-                result = await handler.execute(sample_context)
-                assert result is False
-                mock_logging.error.assert_called_once()
+            result = await handler.execute(sample_context)
+            assert result is False
+            mock_logging.error.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_action_handler_reuse_action(self, sample_context):
         """Test that action handler reuses loaded action."""
         config = {"action_type": "test_action", "action_config": {}}
         handler = ActionHookHandler(config)
 
-        mock_connector = AsyncMock()
-        mock_connector.connect = AsyncMock(return_value=None)
+        connector = _StubConnector()
         mock_action = Mock()
-        mock_action.connector = mock_connector
+        mock_action.connector = connector
         handler.action = mock_action  # Pre-load the action
 
         # Should not call load_action since action is already loaded
@@ -652,37 +752,31 @@ class TestActionHookHandler:
             result = await handler.execute(sample_context)
             assert result is True
             mock_load_action.assert_not_called()
-            mock_connector.connect.assert_called_once()
+            assert len(connector.calls) == 1
 
 
 class TestCreateHookHandler:
     """Test cases for create_hook_handler function."""
 
-    def test_create_message_handler(self, sample_message_hook):
-        """Test creating message hook handler."""
-        handler = create_hook_handler(sample_message_hook)
-        assert isinstance(handler, MessageHookHandler)
-        assert handler.config == sample_message_hook.handler_config
-
-    def test_create_command_handler(self, sample_command_hook):
-        """Test creating command hook handler."""
-        handler = create_hook_handler(sample_command_hook)
-        assert isinstance(handler, CommandHookHandler)
-        assert handler.config == sample_command_hook.handler_config
-
-    def test_create_function_handler(self, sample_function_hook):
-        """Test creating function hook handler."""
-        handler = create_hook_handler(sample_function_hook)
-        assert isinstance(handler, FunctionHookHandler)
-        assert handler.config == sample_function_hook.handler_config
-
-    def test_create_action_handler(self, sample_action_hook):
-        """Test creating action hook handler."""
-        handler = create_hook_handler(sample_action_hook)
-        assert isinstance(handler, ActionHookHandler)
-        assert handler.config == sample_action_hook.handler_config
-
-    def test_create_handler_unknown_type(self):
+    pytestmark = pytest.mark.xdist_group("hook_create_handler")
+
+    @pytest.mark.parametrize(
+        "hook_fixture, handler_cls",
+        [
+            ("sample_message_hook", MessageHookHandler),
+            ("sample_command_hook", CommandHookHandler),
+            ("sample_function_hook", FunctionHookHandler),
+            ("sample_action_hook", ActionHookHandler),
+        ],
+    )
+    def test_create_handler(self, request, hook_fixture, handler_cls):
+        """Test creating a handler for each supported hook type."""
+        hook = request.getfixturevalue(hook_fixture)
+        handler = create_hook_handler(hook)
+        assert isinstance(handler, handler_cls)
+        assert handler.config == hook.handler_config
+
+    def test_create_handler_unknown_type(self, mock_logging):
         """Test creating handler with unknown type."""
         hook = LifecycleHook(
             hook_type=LifecycleHookType.ON_ENTRY,
@@ -690,12 +784,11 @@ class TestCreateHookHandler:
             handler_config={},
         )
 
-        with patch("runtime.multi_mode.hook.logging") as mock_logging:
-            handler = create_hook_handler(hook)
-            assert handler is None
-            mock_logging.error.assert_called_once_with(
-                "Unknown hook handler type: unknown_type"
-            )
+        handler = create_hook_handler(hook)
+        assert handler is None
+        mock_logging.error.assert_called_once_with(
+            "Unknown hook handler type: unknown_type"
+        )
 
     def test_create_handler_case_insensitive(self):
         """Test creating handler with case-insensitive type."""
@@ -708,455 +801,539 @@ class TestCreateHookHandler:
         handler = create_hook_handler(hook)
         assert isinstance(handler, MessageHookHandler)
 
+    def test_create_handler_memoized(self):
+        """Test equal stateless hooks share a handler built from their own config."""
+        hook = _message_hook("test")
+        first = create_hook_handler(hook)
+        second = create_hook_handler(_message_hook("test"))
+        other = create_hook_handler(_message_hook("other"))
 
-class TestParseLifecycleHooks:
-    """Test cases for parse_lifecycle_hooks function."""
+        assert first is second
+        assert first.config is hook.handler_config
+        assert other is not first
 
-    def test_parse_empty_hooks(self):
-        """Test parsing empty hooks list."""
-        result = parse_lifecycle_hooks([])
-        assert result == []
+    def test_create_handler_keeps_config_types(self):
+        """Test handlers get the hook's own config rather than a serialized copy."""
+        hook = LifecycleHook(
+            hook_type=LifecycleHookType.ON_ENTRY,
+            handler_type="message",
+            handler_config={"message": "test", 1: ("a", "b"), "payload": object()},
+        )
 
-    def test_parse_valid_hooks(self):
-        """Test parsing valid hooks configuration."""
-        raw_hooks = [
-            {
-                "hook_type": "on_entry",
-                "handler_type": "message",
-                "handler_config": {"message": "test"},
-                "priority": 1,
-            },
-            {
-                "hook_type": "on_exit",
-                "handler_type": "command",
-                "handler_config": {"command": "echo test"},
-                "async_execution": False,
-                "timeout_seconds": 10.0,
-            },
-        ]
+        handler = create_hook_handler(hook)
+        assert isinstance(handler, MessageHookHandler)
+        assert handler.config is hook.handler_config
+        assert create_hook_handler(hook) is handler
 
-        hooks = parse_lifecycle_hooks(raw_hooks)
-        assert len(hooks) == 2
+    def test_create_handler_action_not_shared(self, sample_action_hook):
+        """Test action handlers, which hold their loaded action, are never shared."""
+        first = create_hook_handler(sample_action_hook)
+        second = create_hook_handler(sample_action_hook)
 
-        assert hooks[0].hook_type == LifecycleHookType.ON_ENTRY
-        assert hooks[0].handler_type == "message"
-        assert hooks[0].priority == 1
+        assert isinstance(first, ActionHookHandler)
+        assert first is not second
 
-        assert hooks[1].hook_type == LifecycleHookType.ON_EXIT
-        assert hooks[1].handler_type == "command"
-        assert hooks[1].async_execution is False
-        assert hooks[1].timeout_seconds == 10.0
+    def test_create_handler_unknown_type_not_cached(self, mock_logging):
+        """Test an unknown handler type is reported on every call."""
+        hook = LifecycleHook(
+            hook_type=LifecycleHookType.ON_ENTRY,
+            handler_type="unknown_type",
+            handler_config={},
+        )
 
-    def test_parse_hooks_with_defaults(self):
-        """Test parsing hooks with default values."""
-        raw_hooks = [
-            {
-                "hook_type": "on_startup",
-                "handler_type": "function",
-                "handler_config": {"function": "test"},
-            }
-        ]
+        assert create_hook_handler(hook) is None
+        assert create_hook_handler(hook) is None
+        assert mock_logging.error.call_count == 2
 
+
+class TestParseLifecycleHooks:
+    """Test cases for parse_lifecycle_hooks function."""
+
+    pytestmark = pytest.mark.xdist_group("hook_parse")
+
+    @pytest.mark.parametrize(
+        "raw_hooks, expected_fields, error_count",
+        [
+            pytest.param([], [], 0, id="empty"),
+            pytest.param(
+                [
+                    {
+                        "hook_type": "on_entry",
+                        "handler_type": "message",
+                        "handler_config": {"message": "test"},
+                        "priority": 1,
+                    },
+                    {
+                        "hook_type": "on_exit",
+                        "handler_type": "command",
+                        "handler_config": {"command": "echo test"},
+                        "async_execution": False,
+                        "timeout_seconds": 10.0,
+                    },
+                ],
+                [
+                    {
+                        "hook_type": LifecycleHookType.ON_ENTRY,
+                        "handler_type": "message",
+                        "priority": 1,
+                    },
+                    {
+                        "hook_type": LifecycleHookType.ON_EXIT,
+                        "handler_type": "command",
+                        "async_execution": False,
+                        "timeout_seconds": 10.0,
+                    },
+                ],
+                0,
+                id="valid",
+            ),
+            pytest.param(
+                [
+                    {
+                        "hook_type": "on_startup",
+                        "handler_type": "function",
+                        "handler_config": {"function": "test"},
+                    }
+                ],
+                [
+                    {
+                        "async_execution": True,
+                        "timeout_seconds": 5.0,
+                        "on_failure": "ignore",
+                        "priority": 0,
+                    }
+                ],
+                0,
+                id="defaults",
+            ),
+            pytest.param(
+                [
+                    {
+                        "hook_type": "invalid_type",
+                        "handler_type": "message",
+                        "handler_config": {"message": "test"},
+                    }
+                ],
+                [],
+                1,
+                id="invalid_hook_type",
+            ),
+            pytest.param(
+                [
+                    {
+                        "handler_type": "message",  # Missing hook_type
+                        "handler_config": {"message": "test"},
+                    },
+                    {
+                        "hook_type": "on_entry",  # Missing handler_type
+                        "handler_config": {"message": "test"},
+                    },
+                ],
+                [],
+                2,
+                id="missing_required_fields",
+            ),
+        ],
+    )
+    def test_parse_hooks(self, raw_hooks, expected_fields, error_count, mock_logging):
+        """Test parsing raw hook configurations."""
         hooks = parse_lifecycle_hooks(raw_hooks)
-        assert len(hooks) == 1
 
-        hook = hooks[0]
-        assert hook.async_execution is True  # Default
-        assert hook.timeout_seconds == 5.0  # Default
-        assert hook.on_failure == "ignore"  # Default
-        assert hook.priority == 0  # Default
+        assert len(hooks) == len(expected_fields)
+        for hook, fields in zip(hooks, expected_fields):
+            for name, value in fields.items():
+                assert getattr(hook, name) == value
+        assert mock_logging.error.call_count == error_count
 
-    def test_parse_hooks_invalid_hook_type(self):
-        """Test parsing hooks with invalid hook type."""
+    def test_parse_hooks_sorted_by_priority(self):
+        """Test parsed hooks come out highest priority first, ties in order."""
         raw_hooks = [
             {
-                "hook_type": "invalid_type",
+                "hook_type": "on_entry",
                 "handler_type": "message",
-                "handler_config": {"message": "test"},
+                "handler_config": {"message": name},
+                "priority": priority,
             }
+            for name, priority in [("low", 0), ("high", 5), ("mid1", 2), ("mid2", 2)]
         ]
 
-        with patch("runtime.multi_mode.hook.logging") as mock_logging:
-            hooks = parse_lifecycle_hooks(raw_hooks)
-            assert len(hooks) == 0
-            mock_logging.error.assert_called_once()
+        hooks = parse_lifecycle_hooks(raw_hooks)
 
-    def test_parse_hooks_missing_required_fields(self):
-        """Test parsing hooks with missing required fields."""
-        raw_hooks = [
-            {
-                "handler_type": "message",  # Missing hook_type
-                "handler_config": {"message": "test"},
-            },
-            {
-                "hook_type": "on_entry",  # Missing handler_type
-                "handler_config": {"message": "test"},
-            },
+        assert [hook.handler_config["message"] for hook in hooks] == [
+            "high",
+            "mid1",
+            "mid2",
+            "low",
         ]
 
-        with patch("runtime.multi_mode.hook.logging") as mock_logging:
-            hooks = parse_lifecycle_hooks(raw_hooks)
-            assert len(hooks) == 0
-            assert mock_logging.error.call_count == 2
-
 
 class TestExecuteLifecycleHooks:
     """Test cases for execute_lifecycle_hooks function."""
 
-    @pytest.mark.asyncio
-    async def test_execute_hooks_empty_list(self):
+    pytestmark = pytest.mark.xdist_group("hook_execute")
+
+    def test_execute_hooks_empty_list(self):
         """Test executing empty hooks list."""
-        result = await execute_lifecycle_hooks([], LifecycleHookType.ON_ENTRY)
+        result = _run_without_loop(
+            execute_lifecycle_hooks([], LifecycleHookType.ON_ENTRY)
+        )
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_execute_hooks_no_matching_type(self, sample_message_hook):
+    def test_execute_hooks_no_matching_type(self, sample_message_hook, mock_logging):
         """Test executing hooks with no matching type."""
         hooks = [sample_message_hook]  # ON_ENTRY hook
-        result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_EXIT)
+        context = {"mode_name": "test_mode"}
+        result = _run_without_loop(
+            execute_lifecycle_hooks(hooks, LifecycleHookType.ON_EXIT, context)
+        )
         assert result is True
+        assert context == {"mode_name": "test_mode"}
+        mock_logging.info.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_execute_hooks_successful(self, sample_context):
+    async def test_execute_hooks_successful(
+        self, mock_create_handler, sample_context, mock_logging
+    ):
         """Test successful execution of matching hooks."""
         hooks = [
-            LifecycleHook(
-                hook_type=LifecycleHookType.ON_ENTRY,
-                handler_type="message",
-                handler_config={"message": "Hook 1"},
-                priority=1,
-            ),
-            LifecycleHook(
-                hook_type=LifecycleHookType.ON_ENTRY,
-                handler_type="message",
-                handler_config={"message": "Hook 2"},
-                priority=2,
-            ),
+            _message_hook("Hook 1", priority=1),
+            _message_hook("Hook 2", priority=2),
         ]
+        handler1 = _StubHandler()
+        handler2 = _StubHandler()
 
-        with patch("runtime.multi_mode.hook.create_hook_handler") as mock_create:
-            mock_handler1 = AsyncMock()
-            mock_handler1.execute.return_value = True
-            mock_handler2 = AsyncMock()
-            mock_handler2.execute.return_value = True
-            mock_create.side_effect = [mock_handler1, mock_handler2]
-
-            with patch("runtime.multi_mode.hook.logging") as mock_logging:
-                result = await execute_lifecycle_hooks(
-                    hooks, LifecycleHookType.ON_ENTRY, sample_context
-                )
-                assert result is True
-                mock_logging.info.assert_called_once_with("Executing 2 on_entry hooks")
-
-                # Verify hooks are executed in priority order (higher priority first)
-                assert mock_create.call_count == 2
-                mock_handler2.execute.assert_called_once()  # Priority 2 first
-                mock_handler1.execute.assert_called_once()  # Priority 1 second
-
-    @pytest.mark.asyncio
-    async def test_execute_hooks_priority_sorting(self):
-        """Test that hooks are executed in priority order."""
+        mock_create_handler.side_effect = [handler2, handler1]
+        result = await execute_lifecycle_hooks(
+            hooks, LifecycleHookType.ON_ENTRY, sample_context
+        )
+        assert result is True
+        mock_logging.info.assert_called_once_with(
+            "Executing %d %s hooks", 2, "on_entry"
+        )
+
+        # Handlers are created in priority order (higher priority first)
+        assert [call.args[0] for call in mock_create_handler.call_args_list] == [
+            hooks[1],
+            hooks[0],
+        ]
+        assert len(handler2.calls) == 1
+        assert len(handler1.calls) == 1
+
+    @pytest.mark.parametrize(
+        "priorities, expected_order",
+        [
+            ([1, 5, 3], [1, 2, 0]),
+            ([3, 1, 2], [0, 2, 1]),
+            ([0, 0, 5], [2, 0, 1]),
+            ([2, 2, 2], [0, 1, 2]),
+        ],
+        ids=["mixed", "first_highest", "ties_below_max", "all_equal"],
+    )
+    async def test_execute_hooks_priority_sorting(
+        self, mock_create_handler, priorities, expected_order
+    ):
+        """Test that hooks run highest priority first, ties in declaration order."""
         hooks = [
-            LifecycleHook(
-                hook_type=LifecycleHookType.ON_ENTRY,
-                handler_type="message",
-                handler_config={"message": "Low priority"},
-                priority=1,
-            ),
-            LifecycleHook(
-                hook_type=LifecycleHookType.ON_ENTRY,
-                handler_type="message",
-                handler_config={"message": "High priority"},
-                priority=5,
-            ),
-            LifecycleHook(
-                hook_type=LifecycleHookType.ON_ENTRY,
-                handler_type="message",
-                handler_config={"message": "Medium priority"},
-                priority=3,
-            ),
+            _message_hook(f"hook{index}", priority=priority)
+            for index, priority in enumerate(priorities)
         ]
 
         execution_order = []
 
         def track_execution(hook):
-            handler = AsyncMock()
-
-            async def execute_with_tracking(context):
-                execution_order.append(hook.handler_config["message"])
-                return True
+            return _StubHandler(
+                on_call=lambda: execution_order.append(hook.handler_config["message"])
+            )
 
-            handler.execute = execute_with_tracking
-            return handler
+        mock_create_handler.side_effect = track_execution
+        result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
+        assert result is True
+        assert execution_order == [f"hook{index}" for index in expected_order]
 
-        with patch(
-            "runtime.multi_mode.hook.create_hook_handler", side_effect=track_execution
-        ):
-            result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
-            assert result is True
-            assert execution_order == [
-                "High priority",
-                "Medium priority",
-                "Low priority",
-            ]
-
-    @pytest.mark.asyncio
-    async def test_execute_hooks_handler_creation_failure(self):
+    async def test_execute_hooks_handler_creation_failure(
+        self, mock_create_handler, mock_logging
+    ):
         """Test execution when handler creation fails."""
-        hooks = [
-            LifecycleHook(
-                hook_type=LifecycleHookType.ON_ENTRY,
-                handler_type="message",
-                handler_config={"message": "test"},
-            )
-        ]
+        hooks = [_message_hook("test")]
 
-        with patch("runtime.multi_mode.hook.create_hook_handler", return_value=None):
-            with patch("runtime.multi_mode.hook.logging") as mock_logging:
-                result = await execute_lifecycle_hooks(
-                    hooks, LifecycleHookType.ON_ENTRY
-                )
-                assert result is False
-                mock_logging.error.assert_called_once()
+        mock_create_handler.return_value = None
+        result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
+        assert result is False
+        mock_logging.error.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_execute_hooks_failure_ignore_policy(self):
+    async def test_execute_hooks_failure_ignore_policy(self, mock_create_handler):
         """Test execution with failure ignore policy."""
-        hooks = [
-            LifecycleHook(
-                hook_type=LifecycleHookType.ON_ENTRY,
-                handler_type="message",
-                handler_config={"message": "test"},
-                on_failure="ignore",
-            )
-        ]
-
-        mock_handler = AsyncMock()
-        mock_handler.execute.return_value = False
+        hooks = [_message_hook("test", on_failure="ignore")]
 
-        with patch(
-            "runtime.multi_mode.hook.create_hook_handler", return_value=mock_handler
-        ):
-            result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
-            assert result is False  # Overall result is False, but execution continues
+        mock_create_handler.return_value = _StubHandler(result=False)
+        result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
+        assert result is False  # Overall result is False, but execution continues
 
-    @pytest.mark.asyncio
-    async def test_execute_hooks_failure_abort_policy(self):
+    async def test_execute_hooks_failure_abort_policy(
+        self, mock_create_handler, mock_logging
+    ):
         """Test execution with failure abort policy."""
         hooks = [
-            LifecycleHook(
-                hook_type=LifecycleHookType.ON_ENTRY,
-                handler_type="message",
-                handler_config={"message": "test1"},
-                on_failure="abort",
-            ),
-            LifecycleHook(
-                hook_type=LifecycleHookType.ON_ENTRY,
-                handler_type="message",
-                handler_config={"message": "test2"},
-            ),
+            _message_hook("test1", on_failure="abort"),
+            _message_hook("test2"),
         ]
+        handler1 = _StubHandler(result=False)
+        handler2 = _StubHandler()
 
-        mock_handler1 = AsyncMock()
-        mock_handler1.execute.return_value = False
-        mock_handler2 = AsyncMock()
-        mock_handler2.execute.return_value = True
-
-        with patch(
-            "runtime.multi_mode.hook.create_hook_handler",
-            side_effect=[mock_handler1, mock_handler2],
-        ):
-            with patch("runtime.multi_mode.hook.logging") as mock_logging:
-                result = await execute_lifecycle_hooks(
-                    hooks, LifecycleHookType.ON_ENTRY
-                )
-                assert result is False
-                mock_logging.error.assert_called_once()
-                mock_handler1.execute.assert_called_once()
-                mock_handler2.execute.assert_not_called()  # Should not execute due to abort
-
-    @pytest.mark.asyncio
-    async def test_execute_hooks_timeout(self):
-        """Test execution with timeout."""
+        mock_create_handler.side_effect = [handler1, handler2]
+        result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
+        assert result is False
+        mock_logging.error.assert_called_once()
+        assert len(handler1.calls) == 1
+        assert handler2.calls == []  # Should not execute due to abort
+
+    async def test_execute_hooks_missing_handler_does_not_abort(
+        self, mock_create_handler, mock_logging
+    ):
+        """Test a hook without a handler fails without triggering its abort policy."""
         hooks = [
-            LifecycleHook(
-                hook_type=LifecycleHookType.ON_ENTRY,
-                handler_type="message",
-                handler_config={"message": "test"},
-                timeout_seconds=0.1,
-            )
+            _message_hook("test1", on_failure="abort"),
+            _message_hook("test2"),
         ]
+        handler2 = _StubHandler()
 
-        async def slow_execution(context):
-            await asyncio.sleep(1)  # Takes longer than timeout
-            return True
+        mock_create_handler.side_effect = [None, handler2]
+        result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
+        assert result is False
+        assert len(handler2.calls) == 1
+        mock_logging.error.assert_called_once_with(
+            "Failed to create handler for lifecycle hook: %s", "message"
+        )
 
-        mock_handler = AsyncMock()
-        mock_handler.execute.side_effect = slow_execution
-
-        with patch(
-            "runtime.multi_mode.hook.create_hook_handler", return_value=mock_handler
-        ):
-            with patch("runtime.multi_mode.hook.logging") as mock_logging:
-                result = await execute_lifecycle_hooks(
-                    hooks, LifecycleHookType.ON_ENTRY
-                )
-                assert result is False
-                mock_logging.error.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_execute_hooks_timeout_abort_policy(self):
-        """Test execution timeout with abort policy."""
-        hooks = [
-            LifecycleHook(
-                hook_type=LifecycleHookType.ON_ENTRY,
-                handler_type="message",
-                handler_config={"message": "test"},
-                timeout_seconds=0.1,
-                on_failure="abort",
-            )
-        ]
+    async def test_execute_hooks_timeout(self, mock_create_handler, mock_logging):
+        """Test execution with timeout."""
+        hooks = [_message_hook("test", timeout_seconds=0.1)]
 
-        async def slow_execution(context):
-            await asyncio.sleep(1)
-            return True
+        # Takes longer than timeout
+        mock_create_handler.return_value = _StubHandler(delay=1)
+        result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
+        assert result is False
+        mock_logging.error.assert_called_once_with(
+            "Lifecycle hook timed out after %s seconds", 0.1
+        )
 
-        mock_handler = AsyncMock()
-        mock_handler.execute.side_effect = slow_execution
+    async def test_execute_hooks_timeout_unwinds_handler(self, mock_create_handler):
+        """Test a timed-out handler has finished unwinding when execution returns."""
+        hooks = [_message_hook("test", timeout_seconds=0.05, on_failure="abort")]
+        unwound = []
+
+        class _SlowHandler:
+            async def execute(self, context):
+                try:
+                    await asyncio.sleep(1)
+                finally:
+                    await asyncio.sleep(0)  # cleanup that itself suspends
+                    unwound.append(True)
+                return True
 
-        with patch(
-            "runtime.multi_mode.hook.create_hook_handler", return_value=mock_handler
-        ):
-            result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
-            assert result is False
+        mock_create_handler.return_value = _SlowHandler()
+        result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
+        assert result is False
+        assert unwound == [True]
 
-    @pytest.mark.asyncio
-    async def test_execute_hooks_no_timeout(self):
-        """Test execution with no timeout specified."""
-        hooks = [
-            LifecycleHook(
-                hook_type=LifecycleHookType.ON_ENTRY,
-                handler_type="message",
-                handler_config={"message": "test"},
-                timeout_seconds=None,
-            )
-        ]
+    async def test_execute_hooks_timeout_uses_asyncio_timeout(
+        self, mock_create_handler, monkeypatch
+    ):
+        """Test that hook timeouts use asyncio.timeout when it is available."""
+        hooks = [_message_hook("test", timeout_seconds=2.0)]
+        mock_timeout = MagicMock()
+        monkeypatch.setattr(asyncio, "timeout", mock_timeout, raising=False)
 
-        mock_handler = AsyncMock()
-        mock_handler.execute.return_value = True
+        mock_create_handler.return_value = _StubHandler()
+        result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
+        assert result is True
+        mock_timeout.assert_called_once_with(2.0)
 
-        with patch(
-            "runtime.multi_mode.hook.create_hook_handler", return_value=mock_handler
-        ):
-            result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
-            assert result is True
+    async def test_execute_hooks_timeout_falls_back_to_wait_for(
+        self, mock_create_handler, monkeypatch
+    ):
+        """Test that hook timeouts use asyncio.wait_for without asyncio.timeout."""
+        hooks = [_message_hook("test", timeout_seconds=2.0)]
+        monkeypatch.delattr(asyncio, "timeout", raising=False)
+        wait_for = asyncio.wait_for
+        mock_wait_for = MagicMock(side_effect=wait_for)
+        monkeypatch.setattr(asyncio, "wait_for", mock_wait_for)
+
+        mock_create_handler.return_value = _StubHandler()
+        result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
+        assert result is True
+        assert mock_wait_for.call_args.kwargs == {"timeout": 2.0}
 
-    @pytest.mark.asyncio
-    async def test_execute_hooks_context_update(self, sample_context):
-        """Test that context is properly updated with hook_type."""
-        hooks = [
-            LifecycleHook(
-                hook_type=LifecycleHookType.ON_ENTRY,
-                handler_type="message",
-                handler_config={"message": "test"},
-            )
-        ]
+    async def test_execute_hooks_timeout_abort_policy(self, mock_create_handler):
+        """Test execution timeout with abort policy."""
+        hooks = [_message_hook("test", timeout_seconds=0.1, on_failure="abort")]
 
-        received_context = None
+        mock_create_handler.return_value = _StubHandler(delay=1)
+        result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
+        assert result is False
 
-        mock_handler = AsyncMock()
+    async def test_execute_hooks_no_timeout(self, mock_create_handler):
+        """Test execution with no timeout specified."""
+        hooks = [_message_hook("test", timeout_seconds=None)]
 
-        async def capture_context(context):
-            nonlocal received_context
-            received_context = context.copy()
-            return True
+        mock_create_handler.return_value = _StubHandler()
+        result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
+        assert result is True
+
+    async def test_execute_hooks_context_update(
+        self, mock_create_handler, sample_context
+    ):
+        """Test that context is properly updated with hook_type."""
+        hooks = [_message_hook("test")]
+        handler = _StubHandler()
 
-        mock_handler.execute = capture_context
+        mock_create_handler.return_value = handler
+        await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY, sample_context)
 
-        with patch(
-            "runtime.multi_mode.hook.create_hook_handler", return_value=mock_handler
-        ):
-            await execute_lifecycle_hooks(
-                hooks, LifecycleHookType.ON_ENTRY, sample_context
-            )
+        assert len(handler.calls) == 1
+        assert handler.calls[0]["hook_type"] == "on_entry"
+        assert handler.calls[0]["mode_name"] == "test_mode"
+        assert "hook_type" not in sample_context
 
-            assert received_context is not None
-            assert received_context["hook_type"] == "on_entry"
-            assert received_context["mode_name"] == "test_mode"
+    async def test_execute_hooks_context_update_dict(
+        self, mock_create_handler, sample_context
+    ):
+        """Test that a dict context is updated in place with hook_type."""
+        hooks = [_message_hook("test")]
+        context = dict(sample_context)
 
-    @pytest.mark.asyncio
-    async def test_execute_hooks_general_exception(self):
+        mock_create_handler.return_value = _StubHandler()
+        await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY, context)
+
+        assert context["hook_type"] == "on_entry"
+
+    async def test_execute_hooks_general_exception(
+        self, mock_create_handler, mock_logging
+    ):
         """Test execution with general exception."""
-        hooks = [
-            LifecycleHook(
-                hook_type=LifecycleHookType.ON_ENTRY,
-                handler_type="message",
-                handler_config={"message": "test"},
-                on_failure="ignore",
-            )
-        ]
+        hooks = [_message_hook("test", on_failure="ignore")]
+
+        mock_create_handler.return_value = _StubHandler(
+            raise_exc=Exception("General error")
+        )
+        result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
+        assert result is False
+        mock_logging.error.assert_called_once()
 
-        mock_handler = AsyncMock()
-        mock_handler.execute.side_effect = Exception("General error")
-
-        with patch(
-            "runtime.multi_mode.hook.create_hook_handler", return_value=mock_handler
-        ):
-            with patch("runtime.multi_mode.hook.logging") as mock_logging:
-                result = await execute_lifecycle_hooks(
-                    hooks, LifecycleHookType.ON_ENTRY
-                )
-                assert result is False
-                mock_logging.error.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_execute_hooks_general_exception_abort(self):
+    async def test_execute_hooks_general_exception_abort(self, mock_create_handler):
         """Test execution with general exception and abort policy."""
+        hooks = [_message_hook("test", on_failure="abort")]
+
+        mock_create_handler.return_value = _StubHandler(
+            raise_exc=Exception("General error")
+        )
+        result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
+        assert result is False
+
+    async def test_execute_hooks_mixed_success_failure(self, mock_create_handler):
+        """Test execution with mixed success and failure."""
         hooks = [
-            LifecycleHook(
-                hook_type=LifecycleHookType.ON_ENTRY,
-                handler_type="message",
-                handler_config={"message": "test"},
-                on_failure="abort",
-            )
+            _message_hook("success", priority=2),
+            _message_hook("failure", priority=1, on_failure="ignore"),
         ]
 
-        mock_handler = AsyncMock()
-        mock_handler.execute.side_effect = Exception("General error")
+        mock_create_handler.side_effect = [_StubHandler(), _StubHandler(result=False)]
+        result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
+        assert result is False  # Overall result is False due to one failure
 
-        with patch(
-            "runtime.multi_mode.hook.create_hook_handler", return_value=mock_handler
-        ):
-            result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
-            assert result is False
+    async def test_execute_hooks_parallel_band_runs_concurrently(
+        self, mock_create_handler
+    ):
+        """Test hooks sharing a priority overlap when run in parallel."""
+        hooks = [_message_hook("a", priority=1), _message_hook("b", priority=1)]
+        both_started = asyncio.Event()
+        started = []
+
+        def mark_started():
+            started.append(True)
+            if len(started) == 2:
+                both_started.set()
+
+        # Each hook gets its own handler; neither finishes until both started
+        handlers = {
+            "a": _StubHandler(wait_for=both_started, on_call=mark_started),
+            "b": _StubHandler(wait_for=both_started, on_call=mark_started),
+        }
+
+        mock_create_handler.side_effect = _handler_by_message(handlers)
+        result = await execute_lifecycle_hooks(
+            hooks, LifecycleHookType.ON_ENTRY, parallel=True
+        )
+        assert result is True
+        for handler in handlers.values():
+            assert len(handler.calls) == 1
 
-    @pytest.mark.asyncio
-    async def test_execute_hooks_mixed_success_failure(self):
-        """Test execution with mixed success and failure."""
+    async def test_execute_hooks_parallel_abort_runs_first(
+        self, mock_create_handler, mock_logging
+    ):
+        """Test a failing abort hook stops its band before the ignore hooks."""
         hooks = [
-            LifecycleHook(
-                hook_type=LifecycleHookType.ON_ENTRY,
-                handler_type="message",
-                handler_config={"message": "success"},
-                priority=2,
-            ),
-            LifecycleHook(
-                hook_type=LifecycleHookType.ON_ENTRY,
-                handler_type="message",
-                handler_config={"message": "failure"},
-                priority=1,
-                on_failure="ignore",
-            ),
+            _message_hook("ignored", priority=1),
+            _message_hook("abort", priority=1, on_failure="abort"),
+            _message_hook("later", priority=0),
+        ]
+        handlers = {
+            "ignored": _StubHandler(),
+            "abort": _StubHandler(result=False),
+            "later": _StubHandler(),
+        }
+
+        mock_create_handler.side_effect = _handler_by_message(handlers)
+        result = await execute_lifecycle_hooks(
+            hooks, LifecycleHookType.ON_ENTRY, parallel=True
+        )
+        assert result is False
+        assert len(handlers["abort"].calls) == 1
+        assert handlers["ignored"].calls == []
+        assert handlers["later"].calls == []
+        mock_logging.error.assert_called_once_with(
+            "Lifecycle hook failed with abort policy, stopping execution"
+        )
+
+    async def test_execute_hooks_parallel_missing_handler_does_not_abort(
+        self, mock_create_handler
+    ):
+        """Test an abort hook without a handler lets its band and later bands run."""
+        hooks = [
+            _message_hook("ignored", priority=1),
+            _message_hook("abort", priority=1, on_failure="abort"),
+            _message_hook("later", priority=0),
         ]
+        handlers = {
+            "ignored": _StubHandler(),
+            "abort": None,
+            "later": _StubHandler(),
+        }
+
+        mock_create_handler.side_effect = _handler_by_message(handlers)
+        result = await execute_lifecycle_hooks(
+            hooks, LifecycleHookType.ON_ENTRY, parallel=True
+        )
+        assert result is False
+        assert len(handlers["ignored"].calls) == 1
+        assert len(handlers["later"].calls) == 1
 
-        mock_handler_success = AsyncMock()
-        mock_handler_success.execute.return_value = True
-        mock_handler_failure = AsyncMock()
-        mock_handler_failure.execute.return_value = False
-
-        with patch(
-            "runtime.multi_mode.hook.create_hook_handler",
-            side_effect=[mock_handler_success, mock_handler_failure],
-        ):
-            result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
-            assert result is False  # Overall result is False due to one failure
+    async def test_execute_hooks_parallel_ignore_failure(self, mock_create_handler):
+        """Test an ignored failure is reported without stopping later bands."""
+        hooks = [
+            _message_hook("failure", priority=1),
+            _message_hook("success", priority=1),
+            _message_hook("later", priority=0),
+        ]
+        handlers = {
+            "failure": _StubHandler(result=False),
+            "success": _StubHandler(),
+            "later": _StubHandler(),
+        }
+
+        mock_create_handler.side_effect = _handler_by_message(handlers)
+        result = await execute_lifecycle_hooks(
+            hooks, LifecycleHookType.ON_ENTRY, parallel=True
+        )
+        assert result is False
+        for handler in handlers.values():
+            assert len(handler.calls) == 1
@@ -1,5 +1,4 @@
 import json
-import tempfile
 import time
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -226,6 +225,17 @@ class TestModeManager:
         result = await mode_manager.check_time_based_transitions()
         assert result == "default"
 
+    async def test_check_time_based_transitions_no_timeout_skips_clock(
+        self, mode_manager
+    ):
+        """Test modes without a timeout return before reading the clock."""
+        mode_manager.config.modes["default"].timeout_seconds = None
+        with patch("runtime.multi_mode.manager.time.time") as mock_time:
+            result = await mode_manager.check_time_based_transitions()
+
+        assert result is None
+        mock_time.assert_not_called()
+
     def test_check_input_triggered_transitions_no_input(self, mode_manager):
         """Test input-triggered transitions with no input."""
         result = mode_manager.check_input_triggered_transitions(None)
@@ -246,6 +256,20 @@ class TestModeManager:
         )
         assert result == "emergency"
 
+    def test_check_input_triggered_transitions_blocked_rule_falls_back(
+        self, mode_manager
+    ):
+        """Test that a blocked higher-priority rule yields to the next match."""
+        with patch.object(
+            mode_manager,
+            "_can_transition",
+            side_effect=lambda rule: rule.to_mode != "emergency",
+        ):
+            result = mode_manager.check_input_triggered_transitions(
+                "advanced emergency help"
+            )
+        assert result == "advanced"
+
     def test_check_input_triggered_transitions_no_match(self, mode_manager):
         """Test input-triggered transitions with no matching keywords."""
         result = mode_manager.check_input_triggered_transitions("just some random text")
@@ -270,7 +294,7 @@ class TestModeManager:
         """Test transition blocked by active cooldown."""
         rule = sample_transition_rules[0]
         transition_key = "default->advanced"
-        mode_manager.transition_cooldowns[transition_key] = time.time()
+        mode_manager.transition_cooldowns[transition_key] = time.monotonic()
 
         result = mode_manager._can_transition(rule)
         assert result is False
@@ -281,7 +305,7 @@ class TestModeManager:
         """Test transition allowed after cooldown expires."""
         rule = sample_transition_rules[0]
         transition_key = "default->advanced"
-        mode_manager.transition_cooldowns[transition_key] = time.time() - 10.0
+        mode_manager.transition_cooldowns[transition_key] = time.monotonic() - 10.0
 
         result = mode_manager._can_transition(rule)
         assert result is True
@@ -495,32 +519,52 @@ class TestModeManager:
         assert path.endswith(".test_config.json5")
         assert "memory" in path
 
+    def test_get_state_file_path_cached(self, mode_manager):
+        """Test the state file path is resolved once."""
+        path = mode_manager._get_state_file_path()
+
+        with patch("runtime.multi_mode.manager.os.path.exists") as mock_exists:
+            assert mode_manager._get_state_file_path() is path
+            mock_exists.assert_not_called()
+
     def test_save_mode_state_disabled(self, mode_manager):
         """Test that state saving is skipped when memory is disabled."""
         mode_manager.config.mode_memory_enabled = False
 
         mode_manager._save_mode_state()
 
-    def test_save_mode_state_success(self, mode_manager):
+    def test_save_mode_state_success(self, mode_manager, tmp_path):
         """Test successful state saving."""
         mode_manager.state.current_mode = "advanced"
         mode_manager.state.previous_mode = "default"
         mode_manager.state.transition_history = ["default->advanced:test"]
+        state_file = tmp_path / "test_state.json5"
+
+        with patch.object(
+            mode_manager, "_get_state_file_path", return_value=str(state_file)
+        ):
+            mode_manager._save_mode_state()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch.object(mode_manager, "_get_state_file_path") as mock_path:
-                state_file = f"{temp_dir}/test_state.json5"
-                mock_path.return_value = state_file
+        saved_data = json.loads(state_file.read_text())
+        assert saved_data["last_active_mode"] == "advanced"
+        assert saved_data["previous_mode"] == "default"
+        assert saved_data["transition_history"] == ["default->advanced:test"]
+        assert "timestamp" in saved_data
 
-                mode_manager._save_mode_state()
+    def test_save_mode_state_replaces_existing_file(self, mode_manager, tmp_path):
+        """Test saving over an existing state file leaves no temp file behind."""
+        mode_manager.state.current_mode = "advanced"
+        state_file = tmp_path / "test_state.json5"
+        state_file.write_text("stale")
 
-                with open(state_file, "r") as f:
-                    saved_data = json.load(f)
+        with patch.object(
+            mode_manager, "_get_state_file_path", return_value=str(state_file)
+        ):
+            mode_manager._save_mode_state()
 
-                assert saved_data["last_active_mode"] == "advanced"
-                assert saved_data["previous_mode"] == "default"
-                assert saved_data["transition_history"] == ["default->advanced:test"]
-                assert "timestamp" in saved_data
+        saved_data = json.loads(state_file.read_text())
+        assert saved_data["last_active_mode"] == "advanced"
+        assert [path.name for path in tmp_path.iterdir()] == ["test_state.json5"]
 
     def test_load_mode_state_no_file(self, mode_manager, sample_system_config):
         """Test loading state when no state file exists."""
@@ -531,7 +575,7 @@ class TestModeManager:
 
             assert mode_manager.state.current_mode == sample_system_config.default_mode
 
-    def test_load_mode_state_success(self, mode_manager):
+    def test_load_mode_state_success(self, mode_manager, tmp_path):
         """Test successful state loading."""
         saved_state = {
             "last_active_mode": "advanced",
@@ -539,65 +583,43 @@ class TestModeManager:
             "timestamp": time.time(),
             "transition_history": ["default->advanced:test"],
         }
+        state_file = tmp_path / "state.json5"
+        state_file.write_text(json.dumps(saved_state))
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json5", delete=False) as f:
-            json.dump(saved_state, f)
-            temp_file = f.name
-
-        try:
-            with patch.object(
-                mode_manager, "_get_state_file_path", return_value=temp_file
-            ):
-                mode_manager._load_mode_state()
-
-                assert mode_manager.state.current_mode == "advanced"
-                assert mode_manager.state.previous_mode == "default"
-                assert mode_manager.state.transition_history == [
-                    "default->advanced:test"
-                ]
-        finally:
-            import os
+        with patch.object(
+            mode_manager, "_get_state_file_path", return_value=str(state_file)
+        ):
+            mode_manager._load_mode_state()
 
-            os.unlink(temp_file)
+        assert mode_manager.state.current_mode == "advanced"
+        assert mode_manager.state.previous_mode == "default"
+        assert mode_manager.state.transition_history == ["default->advanced:test"]
 
-    def test_load_mode_state_invalid_mode(self, mode_manager):
+    def test_load_mode_state_invalid_mode(self, mode_manager, tmp_path):
         """Test loading state with invalid mode falls back to default."""
         saved_state = {
             "last_active_mode": "nonexistent_mode",
             "previous_mode": "default",
             "timestamp": time.time(),
         }
+        state_file = tmp_path / "state.json5"
+        state_file.write_text(json.dumps(saved_state))
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json5", delete=False) as f:
-            json.dump(saved_state, f)
-            temp_file = f.name
-
-        try:
-            with patch.object(
-                mode_manager, "_get_state_file_path", return_value=temp_file
-            ):
-                mode_manager._load_mode_state()
-
-                assert mode_manager.state.current_mode == "default"
-        finally:
-            import os
+        with patch.object(
+            mode_manager, "_get_state_file_path", return_value=str(state_file)
+        ):
+            mode_manager._load_mode_state()
 
-            os.unlink(temp_file)
+        assert mode_manager.state.current_mode == "default"
 
-    def test_load_mode_state_corrupted_file(self, mode_manager):
+    def test_load_mode_state_corrupted_file(self, mode_manager, tmp_path):
         """Test loading state with corrupted file falls back to default."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json5", delete=False) as f:
-            f.write("invalid json content")
-            temp_file = f.name
-
-        try:
-            with patch.object(
-                mode_manager, "_get_state_file_path", return_value=temp_file
-            ):
-                mode_manager._load_mode_state()
+        state_file = tmp_path / "state.json5"
+        state_file.write_text("invalid json content")
 
-                assert mode_manager.state.current_mode == "default"
-        finally:
-            import os
+        with patch.object(
+            mode_manager, "_get_state_file_path", return_value=str(state_file)
+        ):
+            mode_manager._load_mode_state()
 
-            os.unlink(temp_file)
+        assert mode_manager.state.current_mode == "default"
@@ -6,6 +6,13 @@ from simulators import find_module_with_class, load_simulator
 from simulators.base import Simulator
 
 
+@pytest.fixture(autouse=True)
+def clear_find_module_cache():
+    find_module_with_class.cache_clear()
+    yield
+    find_module_with_class.cache_clear()
+
+
 class MockSimulator(Simulator):
     def process_data(self):
         pass
@@ -0,0 +1,40 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).parents[2] / "system_hw_test" / "parse_crsf_radio.py"
+
+
+@pytest.fixture(scope="module")
+def monkeypatch_module():
+    with pytest.MonkeyPatch.context() as mp:
+        yield mp
+
+
+@pytest.fixture(scope="module")
+def parse_crsf_radio(monkeypatch_module):
+    spec = importlib.util.spec_from_file_location("parse_crsf_radio", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    # numba's on-disk cache for the CRC kernel resolves the module by name
+    monkeypatch_module.setitem(sys.modules, "parse_crsf_radio", module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _rc_channels_frame(channels):
+    packed = sum(value << (11 * i) for i, value in enumerate(channels))
+    payload = packed.to_bytes(22, "little")
+    # sync, length (type + payload + crc), type, payload, crc placeholder
+    return bytes([0xC8, len(payload) + 2, 0x16]) + payload + b"\x00"
+
+
+def test_decode_rc_channels(parse_crsf_radio):
+    # channel 15 is spread over the final payload byte, so its top bits are set
+    channels = [174, 992, 1811, 1500, 0, 2047, 1024, 173]
+    channels += [100, 200, 300, 400, 500, 600, 1, 0b11100010011]
+
+    decoded = parse_crsf_radio.decode_rc_channels(_rc_channels_frame(channels))
+
+    assert decoded.tolist() == channels